@@ -0,0 +1,42 @@
+"""관리자 API 엔드포인트
+
+느린 요청 프로파일링 설정 변경 및 기록 조회 기능 제공
+"""
+import secrets
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+
+from app.api.schemas import ProfilingUpdate
+from app.core.config import settings
+from app.core import profiling
+
+router = APIRouter()
+
+
+def verify_admin(x_admin_token: str = Header(None)):
+    """관리자 토큰 확인 (설정에 토큰이 없으면 관리자 API 비활성화, 비교 시간 일정)"""
+    if not settings.ADMIN_TOKEN or not x_admin_token or not secrets.compare_digest(
+        x_admin_token.encode(), settings.ADMIN_TOKEN.encode()
+    ):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="관리자 권한이 없습니다.")
+
+
+@router.get("/profiling", dependencies=[Depends(verify_admin)])
+def get_profiling():
+    """프로파일링 설정 및 최근 느린 요청 조회"""
+    return {
+        "settings": dict(profiling.state),
+        "slow_traces": list(profiling.slow_traces)
+    }
+
+
+@router.put("/profiling", dependencies=[Depends(verify_admin)])
+def update_profiling(data: ProfilingUpdate):
+    """프로파일링 설정 변경 (실행 중 켜기/끄기)"""
+    return {"settings": profiling.configure(data.enabled, data.slow_ms, data.sample_interval_ms)}
+
+
+@router.delete("/profiling/traces", dependencies=[Depends(verify_admin)])
+def clear_slow_traces():
+    """느린 요청 기록 비우기"""
+    profiling.slow_traces.clear()
+    return {"message": "기록을 비웠습니다."}
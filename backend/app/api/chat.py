@@ -1,14 +1,18 @@
 """채팅 관련 API 엔드포인트
 
-친구 검색, 채팅방 생성/조회, 대화 내역 조회 기능 제공
+친구 검색, 채팅방 생성/조회, 그룹 참여자 관리, 대화 내역 조회 기능 제공
 """
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, BackgroundTasks, Depends
 from sqlalchemy.orm import Session
 from typing import Optional
 
 from app.core.database import get_db
-from app.api.schemas import RoomResponse, RoomCreateRequest
+from app.api.schemas import (
+    RoomResponse, RoomCreateRequest, GroupRoomCreateRequest,
+    RoomMembersRequest, MessageResponse
+)
 from app.services.chat_service import ChatService
+from app.api.sockets import evict_room_member
 
 router = APIRouter()
 
@@ -30,6 +34,42 @@ def get_or_create_room(req: RoomCreateRequest, db: Session = Depends(get_db)):
     return ChatService.create_or_get_room(db, req.my_id, req.target_id)
 
 
+@router.post("/group", response_model=RoomResponse)
+def create_group_room(req: GroupRoomCreateRequest, db: Session = Depends(get_db)):
+    """그룹 채팅방 생성"""
+    return ChatService.create_group_room(db, req.my_id, req.member_ids, req.room_name)
+
+
+@router.get("/room/{room_id}/members")
+def get_room_members(room_id: int, db: Session = Depends(get_db)):
+    """채팅방 참여자 목록 조회"""
+    return ChatService.get_room_members(db, room_id)
+
+
+@router.post("/room/{room_id}/members", response_model=MessageResponse)
+def add_room_members(room_id: int, req: RoomMembersRequest, db: Session = Depends(get_db)):
+    """그룹 채팅방 참여자 추가"""
+    ChatService.add_room_members(db, room_id, req.my_id, req.member_ids)
+    return {"message": "참여자가 추가되었습니다."}
+
+
+@router.delete("/room/{room_id}/members/{member_id}", response_model=MessageResponse)
+def remove_room_member(
+    room_id: int,
+    member_id: str,
+    my_id: str,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db)
+):
+    """그룹 채팅방 참여자 제거 (본인이면 나가기)
+
+    제거된 회원의 소켓도 채팅방에서 내보냄 (이후 메시지 수신 차단)
+    """
+    ChatService.remove_room_member(db, room_id, my_id, member_id)
+    background_tasks.add_task(evict_room_member, room_id, member_id)
+    return {"message": "참여자가 제거되었습니다."}
+
+
 @router.get("/list")
 def get_my_rooms(user_id: str, db: Session = Depends(get_db)):
     """내 채팅방 목록 조회"""
@@ -37,6 +77,6 @@ def get_my_rooms(user_id: str, db: Session = Depends(get_db)):
 
 
 @router.get("/history/{room_id}")
-def get_chat_history(room_id: int, db: Session = Depends(get_db)):
-    """채팅방 대화 내역 조회"""
-    return ChatService.get_chat_history(db, room_id)
+def get_chat_history(room_id: int, since: Optional[int] = None, db: Session = Depends(get_db)):
+    """채팅방 대화 내역 조회 (since 지정 시 해당 순번 이후만)"""
+    return ChatService.get_chat_history(db, room_id, since)
@@ -3,7 +3,7 @@
 Pydantic을 사용한 요청/응답 데이터 모델 및 유효성 검증
 """
 from pydantic import BaseModel, EmailStr, Field
-from typing import Optional
+from typing import List, Optional
 
 
 # 요청 스키마
@@ -37,6 +37,26 @@ class RoomCreateRequest(BaseModel):
     target_id: str
 
 
+class GroupRoomCreateRequest(BaseModel):
+    """그룹 채팅방 생성 요청"""
+    my_id: str
+    member_ids: List[str] = Field(..., min_length=1, description="초대할 회원 아이디 목록")
+    room_name: Optional[str] = Field(None, max_length=100, description="채팅방 이름")
+
+
+class RoomMembersRequest(BaseModel):
+    """채팅방 참여자 추가 요청"""
+    my_id: str
+    member_ids: List[str] = Field(..., min_length=1)
+
+
+class ProfilingUpdate(BaseModel):
+    """프로파일링 설정 변경 요청"""
+    enabled: Optional[bool] = None
+    slow_ms: Optional[int] = Field(None, ge=0, description="느린 요청 임계값 (ms)")
+    sample_interval_ms: Optional[int] = Field(None, ge=1, description="스택 샘플 간격 (ms)")
+
+
 # 응답 스키마
 class MessageResponse(BaseModel):
     """기본 메시지 응답"""
@@ -4,11 +4,18 @@
 """
 import socketio
 import logging
+import secrets
+import time
 from datetime import datetime, timedelta, timezone
 from sqlalchemy import text
 from fastapi.concurrency import run_in_threadpool
 
+from app.core.config import settings
 from app.core.database import SessionLocal
+from app.core.profiling import stage
+from app.services.chat_service import ChatService
+from app.services.landmark_recorder import get_recorder
+from app.services.outbox import OutboxService, TALK_CREATED, SIGN_SESSION_ENDED
 
 # 로거 설정
 logger = logging.getLogger("socket")
@@ -18,45 +25,116 @@ logging.basicConfig(level=logging.INFO)
 sio = socketio.AsyncServer(async_mode='asgi', cors_allowed_origins="*")
 
 
+def is_replay_auth(auth) -> bool:
+    """재생(bench.replay_landmarks) 연결 여부 (관리자 토큰이 맞을 때만 인정)"""
+    if not isinstance(auth, dict) or not auth.get("replay"):
+        return False
+    token = auth.get("admin_token") or ""
+    return bool(settings.ADMIN_TOKEN) and secrets.compare_digest(
+        token.encode(), settings.ADMIN_TOKEN.encode()
+    )
+
+
 @sio.event
-async def connect(sid, environ):
-    """클라이언트 연결"""
+async def connect(sid, environ, auth=None):
+    """클라이언트 연결
+
+    재생 연결은 세션에 표시해 두고 녹화/아웃박스 기록에서 제외
+    (합성 세션이 다시 녹화되거나 분석 이벤트로 흘러가지 않도록)
+    """
+    if is_replay_auth(auth):
+        async with sio.session(sid) as session:
+            session["replay"] = True
+        logger.info(f"✅ [Socket] 접속됨 (재생) | SID: {sid}")
+        return
     logger.info(f"✅ [Socket] 접속됨 | SID: {sid}")
 
 
+@sio.event
+async def disconnect(sid):
+    """클라이언트 연결 종료 (진행 중이던 수어 세션 종료 처리)"""
+    await end_sign_session(sid)
+    logger.info(f"🔌 [Socket] 연결 종료 | SID: {sid}")
+
+
+def room_key(room_id) -> str:
+    """DB 방 번호 -> Socket.IO 방 이름 (참여자 수와 무관하게 방 하나)"""
+    return f"talk_room_{room_id}"
+
+
+def check_member_sync(room_id: int, user_id: str) -> bool:
+    """채팅방 참여 여부 확인 (동기 함수)"""
+    db = SessionLocal()
+    try:
+        return ChatService.is_room_member(db, room_id, user_id)
+    finally:
+        db.close()
+
+
 @sio.on("join_room")
 async def handle_join_room(sid, data):
-    """채팅방 입장"""
-    room = data.get("room")
+    """채팅방 입장 (참여자만)"""
+    room_id = data.get("room_id")
     username = data.get("username")
     
-    if room and username:
-        await sio.enter_room(sid, room)
-        logger.info(f"🚪 [입장] {username} -> {room}")
+    if room_id and username:
+        if not await run_in_threadpool(check_member_sync, room_id, username):
+            logger.warning(f"⚠️ [입장 거부] {username} -> {room_id} (참여자 아님)")
+            return
+        
+        await sio.enter_room(sid, room_key(room_id))
+        async with sio.session(sid) as session:
+            session["username"] = username
+        logger.info(f"🚪 [입장] {username} -> {room_id}")
 
 
 @sio.on("leave_room")
 async def handle_leave_room(sid, data):
     """채팅방 퇴장"""
-    room = data.get("room")
+    room_id = data.get("room_id")
     username = data.get("username")
     
-    if room:
-        await sio.leave_room(sid, room)
-        logger.info(f"👋 [퇴장] {username} <- {room}")
+    if room_id:
+        await sio.leave_room(sid, room_key(room_id))
+        logger.info(f"👋 [퇴장] {username} <- {room_id}")
+
+
+async def evict_room_member(room_id: int, member_id: str):
+    """참여자 제거 시 해당 회원의 소켓을 채팅방에서 내보냄
+
+    (join_room 에서 세션에 저장한 username 으로 회원의 소켓을 찾음)
+    """
+    room = room_key(room_id)
+    for sid, _ in list(sio.manager.get_participants("/", room)):
+        # 도중에 연결이 끊긴 소켓은 건너뛰고 나머지 소켓은 계속 처리
+        try:
+            session = await sio.get_session(sid)
+            if session.get("username") != member_id:
+                continue
+            await sio.leave_room(sid, room)
+            await sio.emit("removed_from_room", {"room_id": room_id}, to=sid)
+            logger.info(f"🚫 [강제 퇴장] {member_id} <- {room_id}")
+        except Exception as e:
+            logger.warning(f"⚠️ [강제 퇴장 건너뜀] SID {sid}: {e}")
 
 
 def save_message_sync(room_id: int, sender_id: str, msg: str):
     """채팅 메시지 DB 저장 (동기 함수)
     
+    talk_room.last_talk_seq 를 증가시켜 방별 메시지 순번을 발급.
+    (UPDATE 행 잠금으로 같은 방의 동시 저장이 직렬화됨)
+    발신자가 방 참여자가 아니면 저장하지 않음
+    메시지와 talk.created 이벤트(아웃박스)를 같은 트랜잭션으로 커밋
+    
     Returns:
-        str: 발신자 이름 (full_name)
+        tuple: (발신자 이름, 메시지 순번) 또는 None
     """
     db = SessionLocal()
     try:
         # 사용자 정보 조회
         get_user_sql = text("SELECT member_no, full_name FROM multicampus_schema.member WHERE member_id = :id")
-        user_info = db.execute(get_user_sql, {"id": sender_id}).fetchone()
+        with stage("member_lookup"):
+            user_info = db.execute(get_user_sql, {"id": sender_id}).fetchone()
         
         if not user_info:
             logger.warning(f"⚠️ [DB 저장 실패] 존재하지 않는 사용자: {sender_id}")
@@ -64,24 +142,52 @@ def save_message_sync(room_id: int, sender_id: str, msg: str):
 
         member_no, sender_name = user_info[0], user_info[1]
 
-        # 메시지 저장
+        # 순번 발급 + 메시지 저장
         insert_sql = text("""
+            WITH next_seq AS (
+                UPDATE multicampus_schema.talk_room
+                SET last_talk_seq = last_talk_seq + 1
+                WHERE talk_room_id = :r_id
+                  AND EXISTS (
+                      SELECT 1 FROM multicampus_schema.talk_room_member
+                      WHERE talk_room_id = :r_id AND member_no = :m_no
+                  )
+                RETURNING last_talk_seq
+            )
             INSERT INTO multicampus_schema.talk (
-                talk_room_id, member_no, talk_date, message, create_user
-            ) VALUES (
-                :r_id, :m_no, CURRENT_TIMESTAMP AT TIME ZONE 'Asia/Seoul', :msg, :c_user
+                talk_room_id, talk_seq, member_no, talk_date, message, create_user
             )
+            SELECT :r_id, next_seq.last_talk_seq, :m_no,
+                   CURRENT_TIMESTAMP AT TIME ZONE 'Asia/Seoul', :msg, :c_user
+            FROM next_seq
+            RETURNING talk_seq
         """)
         
-        db.execute(insert_sql, {
-            "r_id": room_id,
-            "m_no": member_no,
-            "msg": msg,
-            "c_user": sender_id
+        with stage("insert"):
+            seq = db.execute(insert_sql, {
+                "r_id": room_id,
+                "m_no": member_no,
+                "msg": msg,
+                "c_user": sender_id
+            }).scalar()
+        
+        if seq is None:
+            logger.warning(f"⚠️ [DB 저장 실패] 채팅방 없음 또는 참여자 아님: {room_id} / {sender_id}")
+            db.rollback()
+            return None
+        
+        OutboxService.add_event(db, TALK_CREATED, room_id, {
+            "room_id": room_id,
+            "seq": seq,
+            "member_no": member_no,
+            "sender_id": sender_id,
+            "message": msg
         })
-        db.commit()
         
-        return sender_name
+        with stage("commit"):
+            db.commit()
+        
+        return sender_name, seq
 
     except Exception as e:
         logger.error(f"❌ [DB 에러] 메시지 저장 실패: {e}")
@@ -96,10 +202,9 @@ async def handle_send_message(sid, data):
     """메시지 전송 처리
     
     1. DB에 메시지 저장
-    2. 같은 방에 있는 모든 클라이언트에게 브로드캐스트
+    2. 방 참여자 수와 무관하게 Socket.IO 방 하나로 브로드캐스트
     """
     room_id = data.get("room_id")
-    room_name = data.get("room")
     sender_id = data.get("username")
     msg = data.get("message")
 
@@ -110,18 +215,121 @@ async def handle_send_message(sid, data):
     if room_id and sender_id and msg:
         try:
             # DB 저장 (별도 스레드)
-            sender_name = await run_in_threadpool(save_message_sync, room_id, sender_id, msg)
+            with stage("threadpool"):
+                saved = await run_in_threadpool(save_message_sync, room_id, sender_id, msg)
             
             # 실시간 전송
-            if sender_name:
+            if saved:
+                sender_name, seq = saved
                 payload = {
+                    "room_id": room_id,
+                    "seq": seq,
                     "sender": sender_id,
                     "sender_name": sender_name,
                     "message": msg,
                     "time": now_kst
                 }
                 
-                await sio.emit("receive_message", payload, room=room_name)
+                with stage("emit"):
+                    await sio.emit("receive_message", payload, room=room_key(room_id))
                 
         except Exception as e:
             logger.error(f"❌ [소켓 에러] 메시지 처리 실패: {e}")
+
+
+def save_sign_session_sync(member_id: str, sign: dict):
+    """수어 세션 종료 이벤트 저장 (동기 함수)"""
+    db = SessionLocal()
+    try:
+        OutboxService.add_event(db, SIGN_SESSION_ENDED, member_id or "anonymous", {
+            "member_id": member_id,
+            "started_at": sign["started_at"],
+            "ended_at": time.time(),
+            "frames": sign["frames"]
+        })
+        db.commit()
+    except Exception as e:
+        logger.error(f"❌ [DB 에러] 수어 세션 이벤트 저장 실패: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+async def end_sign_session(sid):
+    """수어 세션 종료 (녹화 저장 + 세션 이벤트 기록)"""
+    recorder = get_recorder()
+    if recorder:
+        recorder.end_session(sid)
+
+    async with sio.session(sid) as session:
+        sign = session.pop("sign", None)
+        member_id = session.get("username")
+        replay = session.get("replay", False)
+
+    if sign and sign["frames"] and not replay:
+        await run_in_threadpool(save_sign_session_sync, member_id, sign)
+
+
+@sio.on("sign_landmarks")
+async def handle_sign_landmarks(sid, landmarks):
+    """수어 랜드마크 프레임 수신 (녹화 설정 시 기록)"""
+    if not landmarks:
+        return
+
+    async with sio.session(sid) as session:
+        sign = session.setdefault("sign", {"started_at": time.time(), "frames": 0})
+        sign["frames"] += 1
+        member_id = session.get("username")
+        replay = session.get("replay", False)
+
+    recorder = get_recorder()
+    if recorder and not replay:
+        recorder.record_frame(sid, landmarks, member_id)
+
+
+@sio.on("stop_sign")
+async def handle_stop_sign(sid, data=None):
+    """수어 입력 종료"""
+    await end_sign_session(sid)
+
+
+def load_messages_since_sync(room_id: int, since: int):
+    """누락 구간 메시지 조회 (동기 함수)"""
+    db = SessionLocal()
+    try:
+        return ChatService.get_chat_history(db, room_id, since)
+    finally:
+        db.close()
+
+
+@sio.on("resume")
+async def handle_resume(sid, data):
+    """재접속 시 누락 메시지 재전송
+    
+    클라이언트가 마지막으로 받은 순번(since) 이후의 메시지만
+    요청한 클라이언트에게 전송 (전체 내역 재조회 없음, 참여자만)
+    실패해도 항상 resume_messages 로 응답 (error 포함) - 클라이언트가 보류를 풀 수 있도록
+    """
+    room_id = data.get("room_id")
+    username = data.get("username")
+    since = data.get("since") or 0
+
+    async def reply(messages, error=None):
+        await sio.emit("resume_messages", {"room_id": room_id, "messages": messages, "error": error}, to=sid)
+
+    if not room_id or not username:
+        await reply([], "bad_request")
+        return
+
+    try:
+        if not await run_in_threadpool(check_member_sync, room_id, username):
+            logger.warning(f"⚠️ [재동기화 거부] {username} -> {room_id} (참여자 아님)")
+            await reply([], "not_member")
+            return
+
+        messages = await run_in_threadpool(load_messages_since_sync, room_id, since)
+        await reply(messages)
+        logger.info(f"🔁 [재동기화] room {room_id} | since {since} | {len(messages)}건")
+    except Exception as e:
+        logger.error(f"❌ [소켓 에러] 재동기화 실패: {e}")
+        await reply([], "server_error")
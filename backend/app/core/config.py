@@ -3,6 +3,7 @@
 .env 파일로부터 환경 변수를 로드하고 검증
 """
 import os
+from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -19,12 +20,51 @@ class Settings(BaseSettings):
     # JWT 설정
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
+    
+    # 대화 아카이브 설정
+    TALK_ARCHIVE_DIR: str = "talk_archive"   # 상대 경로는 프로젝트 루트 기준
+    TALK_HOT_MONTHS: int = 3                 # DB에 유지할 최근 월 수
+    
+    # 수어 랜드마크 녹화 설정 (부하/회귀 재현용, 기본 꺼짐)
+    LANDMARK_RECORD_ENABLED: bool = False
+    LANDMARK_RECORD_DIR: str = "landmark_records"   # 상대 경로는 프로젝트 루트 기준
+    LANDMARK_CHUNK_MB: int = 64
+    
+    # 느린 요청 프로파일링 설정 (실행 중 /admin/profiling 으로 변경 가능)
+    PROFILE_ENABLED: bool = False
+    PROFILE_SLOW_MS: int = 200
+    PROFILE_SAMPLE_INTERVAL_MS: int = 5
+    
+    # 이벤트 로그 설정 (아웃박스 릴레이 발행 대상)
+    EVENT_LOG_BACKEND: str = "file"          # "redis" (운영) | "file" (테스트/개발)
+    EVENT_LOG_DIR: str = "event_log"         # file 백엔드 저장 경로 (프로젝트 루트 기준)
+    REDIS_URL: str = "redis://localhost:6379/0"
+    EVENT_STREAM: str = "signtalk:events"
+    EVENT_STREAM_MAXLEN: Optional[int] = None
+    
+    # 관리자 API 토큰 (비어 있으면 관리자 API 비활성화)
+    ADMIN_TOKEN: str = ""
 
     @property
     def DATABASE_URL(self) -> str:
         """SQLAlchemy 데이터베이스 연결 URL 생성"""
         return f"postgresql://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
 
+    @property
+    def TALK_ARCHIVE_PATH(self) -> str:
+        """아카이브 파일 저장 경로 (절대 경로)"""
+        return os.path.join(self._project_root, self.TALK_ARCHIVE_DIR)
+
+    @property
+    def LANDMARK_RECORD_PATH(self) -> str:
+        """랜드마크 녹화 파일 저장 경로 (절대 경로)"""
+        return os.path.join(self._project_root, self.LANDMARK_RECORD_DIR)
+
+    @property
+    def EVENT_LOG_PATH(self) -> str:
+        """파일 이벤트 로그 저장 경로 (절대 경로)"""
+        return os.path.join(self._project_root, self.EVENT_LOG_DIR)
+
     # .env 파일 경로 계산 (backend/app/core -> project root)
     _current_file = os.path.abspath(__file__)
     _project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(_current_file))))
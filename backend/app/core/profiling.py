@@ -0,0 +1,251 @@
+"""느린 요청 프로파일링
+
+소켓 이벤트 핸들러와 서비스 정적 메서드를 감싸 단계별 소요 시간을 기록하고,
+임계값을 넘긴 요청은 스택 샘플과 함께 로그/최근 목록에 남김
+
+- 꺼져 있을 때는 전역 플래그 확인 한 번만 하고 원래 함수를 그대로 호출
+- 켜져 있을 때만 샘플러 스레드가 돌면서 임계값을 넘긴 요청의 실행 스택을 수집
+  (작업 스레드 단계 중이면 그 스레드의 스택, 아니면 요청을 처리 중인 asyncio 태스크의 스택)
+- 관리자 API(/admin/profiling)로 실행 중에 켜고 끌 수 있음
+"""
+import sys
+import time
+import asyncio
+import uuid
+import logging
+import functools
+import threading
+import traceback
+import contextvars
+from collections import Counter, deque
+from contextlib import contextmanager, nullcontext
+
+from app.core.config import settings
+
+logger = logging.getLogger("profiling")
+
+# 런타임 설정 (관리자 API로 변경)
+state = {
+    "enabled": settings.PROFILE_ENABLED,
+    "slow_ms": settings.PROFILE_SLOW_MS,
+    "sample_interval_ms": settings.PROFILE_SAMPLE_INTERVAL_MS,
+}
+
+# 최근 느린 요청 기록
+slow_traces = deque(maxlen=50)
+
+_current = contextvars.ContextVar("profiling_trace", default=None)
+_active = {}                    # trace_id -> Trace (샘플러 대상)
+_active_lock = threading.Lock()
+_sampler = None
+
+
+def _running_task():
+    """이벤트 루프 스레드면 현재 태스크, 작업 스레드면 None"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    return asyncio.current_task()
+
+
+class Trace:
+    """요청 하나의 단계별 소요 시간 + 스택 샘플
+
+    thread_id: 요청이 작업 스레드에서 실행 중일 때만 설정 (이벤트 루프 스레드는 다른 요청과 공유)
+    task: 이벤트 루프에서 시작된 요청이면 해당 asyncio 태스크
+    """
+
+    __slots__ = ("trace_id", "name", "started", "stages", "thread_id", "task", "samples")
+
+    def __init__(self, name: str):
+        self.trace_id = uuid.uuid4().hex[:12]
+        self.name = name
+        self.started = time.perf_counter()
+        self.stages = []
+        self.task = _running_task()
+        self.thread_id = None if self.task else threading.get_ident()
+        self.samples = Counter()
+
+    def to_dict(self, total_ms: float) -> dict:
+        return {
+            "trace_id": self.trace_id,
+            "name": self.name,
+            "total_ms": round(total_ms, 2),
+            "stages": [{"stage": n, "ms": round(ms, 2)} for n, ms in self.stages],
+            "stacks": [{"count": c, "stack": s} for s, c in self.samples.most_common(5)],
+        }
+
+
+def _sampler_loop():
+    """임계값을 넘긴 진행 중 요청의 실행 스택 수집"""
+    while state["enabled"]:
+        time.sleep(state["sample_interval_ms"] / 1000)
+        now = time.perf_counter()
+        slow_s = state["slow_ms"] / 1000
+
+        with _active_lock:
+            targets = [t for t in _active.values() if now - t.started >= slow_s]
+        if not targets:
+            continue
+
+        frames = sys._current_frames()
+        for trace in targets:
+            stack = _sample_stack(trace, frames)
+            if not stack:
+                continue
+            # 끝난 요청은 to_dict 에서 samples 를 읽는 중일 수 있으므로 추가하지 않음
+            # (_trace 는 같은 잠금 아래 _active 에서 뺀 뒤에 samples 를 읽음)
+            with _active_lock:
+                if trace.trace_id in _active:
+                    trace.samples[stack] += 1
+
+
+def _sample_stack(trace: Trace, frames: dict):
+    """요청이 지금 실행 중인 위치의 스택 (작업 스레드 우선, 없으면 대기 중인 태스크)"""
+    thread_id = trace.thread_id
+    if thread_id is not None:
+        frame = frames.get(thread_id)
+        return "".join(traceback.format_stack(frame, limit=30)) if frame is not None else None
+
+    task = trace.task
+    if task is None or task.done():
+        return None
+    # Task.get_stack() 는 바깥 코루틴 프레임만 주므로 await 체인을 따라 내려감
+    task_frames = []
+    coro = task.get_coro()
+    while coro is not None and len(task_frames) < 30:
+        frame = getattr(coro, "cr_frame", None) or getattr(coro, "gi_frame", None)
+        if frame is None:
+            break
+        task_frames.append(frame)
+        coro = getattr(coro, "cr_await", None) or getattr(coro, "gi_yieldfrom", None)
+    if not task_frames:
+        return None
+    summary = traceback.StackSummary.extract((f, f.f_lineno) for f in task_frames)
+    return "".join(summary.format())
+
+
+def _ensure_sampler():
+    global _sampler
+    if _sampler is None or not _sampler.is_alive():
+        _sampler = threading.Thread(target=_sampler_loop, name="profiling-sampler", daemon=True)
+        _sampler.start()
+
+
+def configure(enabled: bool = None, slow_ms: int = None, sample_interval_ms: int = None) -> dict:
+    """런타임 설정 변경 (켜면 샘플러 시작, 끄면 샘플러 종료)"""
+    if slow_ms is not None:
+        state["slow_ms"] = slow_ms
+    if sample_interval_ms is not None:
+        state["sample_interval_ms"] = max(1, sample_interval_ms)
+    if enabled is not None:
+        state["enabled"] = enabled
+        if enabled:
+            _ensure_sampler()
+        else:
+            with _active_lock:
+                _active.clear()
+    return dict(state)
+
+
+@contextmanager
+def _trace(name: str):
+    trace = Trace(name)
+    token = _current.set(trace)
+    with _active_lock:
+        _active[trace.trace_id] = trace
+    try:
+        yield trace
+    finally:
+        _current.reset(token)
+        with _active_lock:
+            _active.pop(trace.trace_id, None)
+
+        total_ms = (time.perf_counter() - trace.started) * 1000
+        if total_ms >= state["slow_ms"]:
+            record = trace.to_dict(total_ms)
+            slow_traces.append(record)
+            stages = ", ".join(f"{s['stage']}={s['ms']}ms" for s in record["stages"])
+            logger.warning(f"🐢 [느린 요청] {name} {record['total_ms']}ms | {stages}")
+
+
+@contextmanager
+def _stage(trace: Trace, name: str):
+    # 작업 스레드(run_in_threadpool 등) 안의 단계만 스레드 스택 샘플 대상
+    prev_thread = trace.thread_id
+    if _running_task() is None:
+        trace.thread_id = threading.get_ident()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        trace.stages.append((name, (time.perf_counter() - started) * 1000))
+        trace.thread_id = prev_thread
+
+
+_NOOP = nullcontext()
+
+
+def stage(name: str):
+    """단계 시간 측정 (추적 중인 요청 안에서만 기록)
+
+    사용:
+        with stage("commit"):
+            db.commit()
+    """
+    if not state["enabled"]:
+        return _NOOP
+    trace = _current.get()
+    if trace is None:
+        return _NOOP
+    return _stage(trace, name)
+
+
+def instrument_socket(sio):
+    """등록된 Socket.IO 이벤트 핸들러 전체를 추적 래퍼로 교체
+
+    (모든 @sio.on 등록이 끝난 뒤 호출)
+    """
+    for namespace, handlers in sio.handlers.items():
+        for event, handler in list(handlers.items()):
+            if asyncio.iscoroutinefunction(handler):
+                handlers[event] = _wrap_handler(f"socket:{event}", handler)
+
+
+def _wrap_handler(name: str, handler):
+    @functools.wraps(handler)
+    async def wrapper(*args, **kwargs):
+        if not state["enabled"]:
+            return await handler(*args, **kwargs)
+        with _trace(name):
+            return await handler(*args, **kwargs)
+    return wrapper
+
+
+def instrument_service(cls):
+    """서비스 클래스의 정적 메서드를 단계 측정 래퍼로 교체
+
+    추적 중인 요청 밖(HTTP 라우터 등)에서 호출되면 해당 호출이 새 추적이 됨
+    """
+    for attr_name, attr in list(vars(cls).items()):
+        if isinstance(attr, staticmethod):
+            setattr(cls, attr_name, staticmethod(_wrap_call(f"{cls.__name__}.{attr_name}", attr.__func__)))
+    return cls
+
+
+def _wrap_call(name: str, func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not state["enabled"]:
+            return func(*args, **kwargs)
+        if _current.get() is None:
+            with _trace(name):
+                return func(*args, **kwargs)
+        with stage(name):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+if state["enabled"]:
+    _ensure_sampler()
@@ -3,15 +3,28 @@
 Socket.IO를 지원하는 채팅 서버 설정
 """
 import socketio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.auth import router as auth_router
 from app.api.chat import router as chat_router
+from app.api.admin import router as admin_router
 from app.api.sockets import sio
+from app.core.profiling import instrument_socket, instrument_service
+from app.services.auth_service import AuthService
+from app.services.chat_service import ChatService
+from app.services.landmark_recorder import close_recorder
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """서버 종료 시 녹화 중인 수어 세션 저장 (Socket.IO ASGIApp 이 lifespan 을 FastAPI 로 넘겨줌)"""
+    yield
+    close_recorder()
+
 
 # FastAPI 앱 생성
-app = FastAPI(title="Chat API", version="1.0.0")
+app = FastAPI(title="Chat API", version="1.0.0", lifespan=lifespan)
 
 # CORS 설정 - 개발 환경용 (프로덕션에서는 특정 origin만 허용)
 app.add_middleware(
@@ -24,6 +37,12 @@ app.add_middleware(
 # API 라우터 등록
 app.include_router(auth_router, prefix="/auth", tags=["인증"])
 app.include_router(chat_router, prefix="/chat", tags=["채팅"])
+app.include_router(admin_router, prefix="/admin", tags=["관리자"])
+
+# 느린 요청 프로파일링 - 소켓 핸들러/서비스 메서드 래핑 (꺼져 있으면 플래그 확인만)
+instrument_socket(sio)
+instrument_service(AuthService)
+instrument_service(ChatService)
 
 # Socket.IO 통합 - FastAPI 앱을 Socket.IO ASGI 앱으로 래핑
 app = socketio.ASGIApp(sio, app)
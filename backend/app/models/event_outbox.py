@@ -0,0 +1,39 @@
+"""이벤트 아웃박스 모델
+
+EventOutbox 테이블 ORM 모델 정의
+"""
+from sqlalchemy import Column, BigInteger, String, TIMESTAMP, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
+from app.core.database import Base
+
+
+class EventOutbox(Base):
+    """발행 대기 이벤트 테이블 (업무 데이터와 같은 트랜잭션에서 기록)"""
+    
+    __tablename__ = "event_outbox"
+    __table_args__ = (
+        # 미발행 이벤트 조회용
+        Index(
+            "event_outbox_unpublished_idx", "event_id",
+            postgresql_where=text("publish_date IS NULL")
+        ),
+        {'schema': 'multicampus_schema'}
+    )
+
+    # 기본 키 (발행 순서)
+    event_id = Column(BigInteger, primary_key=True)
+    
+    # 이벤트 정보
+    event_type = Column(String(50), nullable=False)
+    aggregate_id = Column(String(50), nullable=False)
+    payload = Column(JSONB, nullable=False)
+    
+    # 생성/발행 시각
+    create_date = Column(
+        TIMESTAMP(timezone=False), nullable=False,
+        server_default=text("(CURRENT_TIMESTAMP AT TIME ZONE 'Asia/Seoul')")
+    )
+    publish_date = Column(TIMESTAMP(timezone=False), nullable=True)
+
+    def __repr__(self):
+        return f"<EventOutbox(id={self.event_id}, type='{self.event_type}', aggregate='{self.aggregate_id}')>"
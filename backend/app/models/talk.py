@@ -0,0 +1,31 @@
+"""대화 메시지 모델
+
+Talk 테이블 ORM 모델 정의
+"""
+from sqlalchemy import Column, Integer, BigInteger, String, TIMESTAMP
+from app.core.database import Base
+
+
+class Talk(Base):
+    """채팅 메시지 테이블 (talk_date 기준 월별 파티션)"""
+    
+    __tablename__ = "talk"
+    __table_args__ = {
+        'schema': 'multicampus_schema',
+        'postgresql_partition_by': 'RANGE (talk_date)'
+    }
+
+    # 기본 키 (방 번호 + 방별 순번, 파티션 키 포함)
+    talk_room_id = Column(Integer, primary_key=True, nullable=False)
+    talk_seq = Column(BigInteger, primary_key=True, nullable=False)
+    talk_date = Column(TIMESTAMP(timezone=False), primary_key=True, nullable=False)
+    
+    # 메시지 정보
+    member_no = Column(Integer, nullable=False)
+    message = Column(String, nullable=False)
+    
+    # 메타 정보 (생성 이력)
+    create_user = Column(String(50), nullable=False)
+
+    def __repr__(self):
+        return f"<Talk(room={self.talk_room_id}, seq={self.talk_seq}, member={self.member_no})>"
@@ -2,12 +2,12 @@
 
 TalkRoom 테이블 ORM 모델 정의
 """
-from sqlalchemy import Column, Integer, String, TIMESTAMP, func
+from sqlalchemy import Column, Integer, BigInteger, String, Boolean, TIMESTAMP, func
 from app.core.database import Base
 
 
 class TalkRoom(Base):
-    """1:1 채팅방 정보 테이블"""
+    """채팅방 정보 테이블 (참여자는 talk_room_member)"""
     
     __tablename__ = "talk_room"
     __table_args__ = {'schema': 'multicampus_schema'}
@@ -15,9 +15,12 @@ class TalkRoom(Base):
     # 기본 키
     talk_room_id = Column(Integer, primary_key=True, index=True, nullable=False)
     
-    # 참여자
-    member_no1 = Column(Integer, nullable=False)
-    member_no2 = Column(Integer, nullable=False)
+    # 방 정보
+    talk_room_name = Column(String(100), nullable=True)
+    is_group = Column(Boolean, nullable=False, default=False, server_default="false")
+    
+    # 마지막으로 발급한 메시지 순번 (talk.talk_seq)
+    last_talk_seq = Column(BigInteger, nullable=False, default=0, server_default="0")
     
     # 메타 정보 (생성/수정/삭제 이력)
     create_user = Column(String(50), nullable=False)
@@ -28,4 +31,4 @@ class TalkRoom(Base):
     delete_date = Column(TIMESTAMP(timezone=False), nullable=True)
 
     def __repr__(self):
-        return f"<TalkRoom(id={self.talk_room_id}, members={self.member_no1}&{self.member_no2})>"
+        return f"<TalkRoom(id={self.talk_room_id}, group={self.is_group}, name='{self.talk_room_name}')>"
@@ -0,0 +1,32 @@
+"""채팅방 참여자 모델
+
+TalkRoomMember 테이블 ORM 모델 정의
+"""
+from sqlalchemy import Column, Integer, String, TIMESTAMP, ForeignKey, Index, func
+from app.core.database import Base
+
+
+class TalkRoomMember(Base):
+    """채팅방 참여자 테이블 (방 1개 : 참여자 N명)"""
+    
+    __tablename__ = "talk_room_member"
+    __table_args__ = (
+        # 내 채팅방 목록 조회용
+        Index("talk_room_member_member_idx", "member_no", "talk_room_id"),
+        {'schema': 'multicampus_schema'}
+    )
+
+    # 기본 키 (방 번호 + 회원 번호)
+    talk_room_id = Column(
+        Integer,
+        ForeignKey("multicampus_schema.talk_room.talk_room_id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    member_no = Column(Integer, primary_key=True)
+    
+    # 메타 정보 (생성 이력)
+    create_user = Column(String(50), nullable=False)
+    create_date = Column(TIMESTAMP(timezone=False), nullable=False, server_default=func.now())
+
+    def __repr__(self):
+        return f"<TalkRoomMember(room={self.talk_room_id}, member={self.member_no})>"
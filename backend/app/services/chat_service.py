@@ -6,6 +6,9 @@ from sqlalchemy.orm import Session
 from sqlalchemy import text
 from fastapi import HTTPException
 
+from app.services.talk_archive import TalkArchiveService
+from app.services.outbox import OutboxService, TALK_ROOM_CREATED
+
 
 class ChatService:
     """채팅 관련 비즈니스 로직 처리"""
@@ -44,6 +47,61 @@ class ChatService:
             for row in results
         ]
 
+    @staticmethod
+    def _get_member_nos(db: Session, member_ids: list):
+        """회원 아이디 -> 회원 번호 변환
+        
+        Returns:
+            dict: {member_id: member_no}
+        """
+        sql = text("""
+            SELECT member_id, member_no FROM multicampus_schema.member
+            WHERE member_id = ANY(:ids) AND delete_date IS NULL
+        """)
+        found = {row[0]: row[1] for row in db.execute(sql, {"ids": list(member_ids)}).fetchall()}
+        
+        if len(found) != len(set(member_ids)):
+            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
+        return found
+
+    @staticmethod
+    def _create_room(db: Session, creator: str, member_nos: list, is_group: bool, room_name: str = None):
+        """채팅방 + 참여자 + 생성 이벤트 저장 (같은 트랜잭션)
+        
+        Returns:
+            int: 새 방 번호
+        """
+        create_room_sql = text("""
+            INSERT INTO multicampus_schema.talk_room (
+                talk_room_id, talk_room_name, is_group, create_user
+            ) VALUES (
+                nextval('multicampus_schema.talk_room_id_s'), :name, :is_group, :creator
+            ) RETURNING talk_room_id
+        """)
+        add_member_sql = text("""
+            INSERT INTO multicampus_schema.talk_room_member (talk_room_id, member_no, create_user)
+            SELECT :r_id, m_no, :creator FROM unnest(CAST(:nos AS INTEGER[])) AS m_no
+            ON CONFLICT DO NOTHING
+        """)
+        
+        try:
+            room_id = db.execute(create_room_sql, {
+                "name": room_name, "is_group": is_group, "creator": creator
+            }).scalar()
+            db.execute(add_member_sql, {"r_id": room_id, "nos": list(member_nos), "creator": creator})
+            OutboxService.add_event(db, TALK_ROOM_CREATED, room_id, {
+                "room_id": room_id,
+                "is_group": is_group,
+                "room_name": room_name,
+                "member_nos": list(member_nos),
+                "creator": creator
+            })
+            db.commit()
+            return room_id
+        except Exception as e:
+            db.rollback()
+            raise HTTPException(status_code=500, detail="채팅방 생성 실패")
+
     @staticmethod
     def create_or_get_room(db: Session, my_id: str, target_id: str):
         """채팅방 생성 또는 조회
@@ -53,19 +111,24 @@ class ChatService:
         Returns:
             dict: {"room_id": int, "message": str}
         """
+        # 자기 자신과의 1:1 방은 없음 (아래 조회가 본인 참여 행끼리 매칭되어 엉뚱한 방을 반환)
+        if my_id == target_id:
+            raise HTTPException(status_code=400, detail="자기 자신과는 채팅방을 만들 수 없습니다.")
+
         # 회원 번호 조회
-        get_no_sql = text("SELECT member_no FROM multicampus_schema.member WHERE member_id = :id")
-        my_no = db.execute(get_no_sql, {"id": my_id}).scalar()
-        target_no = db.execute(get_no_sql, {"id": target_id}).scalar()
-        
-        if not my_no or not target_no:
-            raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
+        member_nos = ChatService._get_member_nos(db, [my_id, target_id])
+        my_no, target_no = member_nos[my_id], member_nos[target_id]
 
-        # 기존 방 확인
+        # 기존 방 확인 (두 사람이 모두 참여한 1:1 방)
         check_room_sql = text("""
-            SELECT talk_room_id FROM multicampus_schema.talk_room
-            WHERE (member_no1 = :m1 AND member_no2 = :m2)
-               OR (member_no1 = :m2 AND member_no2 = :m1)
+            SELECT R.talk_room_id
+            FROM multicampus_schema.talk_room_member M1
+            JOIN multicampus_schema.talk_room_member M2
+              ON M2.talk_room_id = M1.talk_room_id AND M2.member_no = :m2
+            JOIN multicampus_schema.talk_room R
+              ON R.talk_room_id = M1.talk_room_id AND R.is_group = FALSE
+            WHERE M1.member_no = :m1
+            LIMIT 1
         """)
         room_id = db.execute(check_room_sql, {"m1": my_no, "m2": target_no}).scalar()
 
@@ -73,90 +136,208 @@ class ChatService:
             return {"room_id": room_id, "message": "이미 존재하는 채팅방입니다."}
 
         # 새 방 생성
-        create_room_sql = text("""
-            INSERT INTO multicampus_schema.talk_room (
-                talk_room_id, member_no1, member_no2, create_user
-            ) VALUES (
-                nextval('multicampus_schema.talk_room_id_s'), :m1, :m2, :creator
-            ) RETURNING talk_room_id
+        new_room_id = ChatService._create_room(db, my_id, [my_no, target_no], is_group=False)
+        return {"room_id": new_room_id, "message": "새 채팅방 생성 완료"}
+
+    @staticmethod
+    def create_group_room(db: Session, my_id: str, member_ids: list, room_name: str = None):
+        """그룹 채팅방 생성 (본인 포함)
+        
+        Returns:
+            dict: {"room_id": int, "message": str}
+        """
+        member_nos = ChatService._get_member_nos(db, [my_id, *member_ids])
+        new_room_id = ChatService._create_room(
+            db, my_id, list(member_nos.values()), is_group=True, room_name=room_name
+        )
+        return {"room_id": new_room_id, "message": "그룹 채팅방 생성 완료"}
+
+    @staticmethod
+    def _check_group_member(db: Session, room_id: int, my_id: str):
+        """그룹 방 참여자인지 확인 (아니면 예외)"""
+        sql = text("""
+            SELECT R.is_group
+            FROM multicampus_schema.talk_room R
+            JOIN multicampus_schema.talk_room_member RM ON RM.talk_room_id = R.talk_room_id
+            JOIN multicampus_schema.member M ON M.member_no = RM.member_no
+            WHERE R.talk_room_id = :r_id AND M.member_id = :id
+        """)
+        is_group = db.execute(sql, {"r_id": room_id, "id": my_id}).scalar()
+        
+        if is_group is None:
+            raise HTTPException(status_code=403, detail="채팅방 참여자가 아닙니다.")
+        if not is_group:
+            raise HTTPException(status_code=400, detail="1:1 채팅방은 참여자를 변경할 수 없습니다.")
+
+    @staticmethod
+    def add_room_members(db: Session, room_id: int, my_id: str, member_ids: list):
+        """그룹 채팅방 참여자 추가"""
+        ChatService._check_group_member(db, room_id, my_id)
+        member_nos = ChatService._get_member_nos(db, member_ids)
+        
+        add_member_sql = text("""
+            INSERT INTO multicampus_schema.talk_room_member (talk_room_id, member_no, create_user)
+            SELECT :r_id, m_no, :creator FROM unnest(CAST(:nos AS INTEGER[])) AS m_no
+            ON CONFLICT DO NOTHING
         """)
         
         try:
-            new_room_id = db.execute(create_room_sql, {
-                "m1": my_no, "m2": target_no, "creator": my_id
-            }).scalar()
-            
+            db.execute(add_member_sql, {"r_id": room_id, "nos": list(member_nos.values()), "creator": my_id})
             db.commit()
-            return {"room_id": new_room_id, "message": "새 채팅방 생성 완료"}
         except Exception as e:
             db.rollback()
-            raise HTTPException(status_code=500, detail="채팅방 생성 실패")
+            raise HTTPException(status_code=500, detail=f"참여자 추가 실패: {str(e)}")
 
     @staticmethod
-    def get_my_rooms(db: Session, user_id: str):
-        """내 채팅방 목록 조회
+    def remove_room_member(db: Session, room_id: int, my_id: str, member_id: str):
+        """그룹 채팅방 참여자 제거 (본인이면 나가기)"""
+        ChatService._check_group_member(db, room_id, my_id)
+        
+        remove_sql = text("""
+            DELETE FROM multicampus_schema.talk_room_member
+            WHERE talk_room_id = :r_id
+              AND member_no = (SELECT member_no FROM multicampus_schema.member WHERE member_id = :id)
+        """)
+        
+        try:
+            deleted = db.execute(remove_sql, {"r_id": room_id, "id": member_id}).rowcount
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            raise HTTPException(status_code=500, detail=f"참여자 제거 실패: {str(e)}")
+        
+        if not deleted:
+            raise HTTPException(status_code=404, detail="채팅방 참여자가 아닙니다.")
+
+    @staticmethod
+    def get_room_members(db: Session, room_id: int):
+        """채팅방 참여자 목록 조회
         
         Returns:
             list: [{"user_id", "user_name"}, ...]
         """
-        # 내 회원 번호 조회
-        my_no_sql = text("SELECT member_no FROM multicampus_schema.member WHERE member_id = :id")
-        my_no = db.execute(my_no_sql, {"id": user_id}).scalar()
+        sql = text("""
+            SELECT M.member_id, M.full_name
+            FROM multicampus_schema.talk_room_member RM
+            JOIN multicampus_schema.member M ON M.member_no = RM.member_no
+            WHERE RM.talk_room_id = :r_id
+            ORDER BY M.full_name
+        """)
+        results = db.execute(sql, {"r_id": room_id}).fetchall()
+        
+        return [{"user_id": row[0], "user_name": row[1]} for row in results]
 
-        # 채팅 목록 조회 (UNION으로 member_no1, member_no2 양쪽 처리)
+    @staticmethod
+    def is_room_member(db: Session, room_id: int, user_id: str) -> bool:
+        """채팅방 참여 여부 확인"""
+        sql = text("""
+            SELECT 1
+            FROM multicampus_schema.talk_room_member RM
+            JOIN multicampus_schema.member M ON M.member_no = RM.member_no
+            WHERE RM.talk_room_id = :r_id AND M.member_id = :id
+        """)
+        return db.execute(sql, {"r_id": room_id, "id": user_id}).scalar() is not None
+
+    @staticmethod
+    def get_my_rooms(db: Session, user_id: str):
+        """내 채팅방 목록 조회
+        
+        참여자 테이블 한 번 조회로 방별 상대 목록을 묶어서 반환.
+        1:1 방은 상대방의 user_id/user_name 을 함께 제공
+        
+        Returns:
+            list: [{"room_id", "room_name", "is_group", "user_id", "user_name", "members"}, ...]
+        """
         chat_list_sql = text("""
-            SELECT A1.member_no1 AS member_no,
-                   (SELECT CC1.member_id FROM multicampus_schema.member CC1 WHERE A1.member_no1 = CC1.member_no) AS member_id,
-                   (SELECT CC1.full_name FROM multicampus_schema.member CC1 WHERE A1.member_no1 = CC1.member_no) AS full_name
-            FROM (
-                SELECT BB1.member_no1, BB1.member_no2
-                FROM multicampus_schema.member AA1, multicampus_schema.talk_room BB1
-                WHERE AA1.member_no = :my_no 
-                  AND (AA1.member_no = BB1.member_no1 OR AA1.member_no = BB1.member_no2)
-            ) A1
-            WHERE A1.member_no1 != :my_no
-            UNION
-            SELECT A2.member_no2 AS member_no,
-                   (SELECT CC2.member_id FROM multicampus_schema.member CC2 WHERE A2.member_no2 = CC2.member_no) AS member_id,
-                   (SELECT CC2.full_name FROM multicampus_schema.member CC2 WHERE A2.member_no2 = CC2.member_no) AS full_name
-            FROM (
-                SELECT BB2.member_no1, BB2.member_no2
-                FROM multicampus_schema.member AA2, multicampus_schema.talk_room BB2
-                WHERE AA2.member_no = :my_no 
-                  AND (AA2.member_no = BB2.member_no1 OR AA2.member_no = BB2.member_no2)
-            ) A2
-            WHERE A2.member_no2 != :my_no
+            SELECT R.talk_room_id, R.talk_room_name, R.is_group, OM.member_id, OM.full_name
+            FROM multicampus_schema.member ME
+            JOIN multicampus_schema.talk_room_member MY ON MY.member_no = ME.member_no
+            JOIN multicampus_schema.talk_room R ON R.talk_room_id = MY.talk_room_id
+            LEFT JOIN multicampus_schema.talk_room_member O
+              ON O.talk_room_id = MY.talk_room_id AND O.member_no != MY.member_no
+            LEFT JOIN multicampus_schema.member OM ON OM.member_no = O.member_no
+            WHERE ME.member_id = :id
+            ORDER BY R.talk_room_id, OM.full_name
         """)
         
-        results = db.execute(chat_list_sql, {"my_no": my_no}).fetchall()
+        results = db.execute(chat_list_sql, {"id": user_id}).fetchall()
         
-        return [
-            {"user_id": row[1], "user_name": row[2]} 
-            for row in results
-        ]
+        rooms = {}
+        for room_id, room_name, is_group, member_id, full_name in results:
+            room = rooms.setdefault(room_id, {
+                "room_id": room_id,
+                "room_name": room_name,
+                "is_group": is_group,
+                "members": []
+            })
+            if member_id:
+                room["members"].append({"user_id": member_id, "user_name": full_name})
+        
+        for room in rooms.values():
+            others = room["members"]
+            if not room["is_group"] and others:
+                room["user_id"] = others[0]["user_id"]
+                room["user_name"] = others[0]["user_name"]
+            else:
+                room["user_id"] = None
+                room["user_name"] = room["room_name"] or ", ".join(m["user_name"] for m in others)
+        
+        return list(rooms.values())
 
     @staticmethod
-    def get_chat_history(db: Session, room_id: int):
+    def get_chat_history(db: Session, room_id: int, since: int = None):
         """채팅방 대화 내역 조회
         
+        since가 주어지면 해당 순번(talk_seq) 이후 메시지만 반환
+        (재접속 시 누락 구간만 다시 받기 위함)
+        
+        DB(최근 파티션)와 아카이브 파일을 합쳐서 반환.
+        아카이브는 since 이후 메시지가 있는 파일만 읽음
+        
         Returns:
-            list: [{"message", "sender", "sender_name", "date"}, ...]
+            list: [{"seq", "message", "sender", "sender_name", "date"}, ...]
         """
+        since = since or 0
         history_sql = text("""
-            SELECT T.message, M.member_id, M.full_name, T.talk_date
+            SELECT T.talk_seq, T.message, M.member_id, M.full_name, T.talk_date
             FROM multicampus_schema.talk T
             JOIN multicampus_schema.member M ON T.member_no = M.member_no
             WHERE T.talk_room_id = :r_id
-            ORDER BY T.talk_date ASC
+              AND T.talk_seq > :since
+            ORDER BY T.talk_seq ASC
         """)
         
-        results = db.execute(history_sql, {"r_id": room_id}).fetchall()
+        results = db.execute(history_sql, {"r_id": room_id, "since": since}).fetchall()
+        rows = [tuple(row) for row in results]
+        
+        # 아카이브 구간 (DB 보다 오래된 메시지)
+        archived = TalkArchiveService.get_room_messages(room_id, since)
+        if archived:
+            member_sql = text("""
+                SELECT member_no, member_id, full_name
+                FROM multicampus_schema.member
+                WHERE member_no = ANY(:nos)
+            """)
+            member_nos = list({row[1] for row in archived})
+            members = {
+                row[0]: (row[1], row[2])
+                for row in db.execute(member_sql, {"nos": member_nos}).fetchall()
+            }
+            
+            hot_seqs = {row[0] for row in rows}
+            archived_rows = [
+                (seq, msg, *members.get(member_no, (None, None)), talk_date)
+                for seq, member_no, talk_date, msg in archived
+                if seq not in hot_seqs
+            ]
+            rows = archived_rows + rows
         
         return [
             {
-                "message": row[0], 
-                "sender": row[1],
-                "sender_name": row[2],
-                "date": row[3].strftime("%H:%M")
-            } for row in results
+                "seq": row[0],
+                "message": row[1], 
+                "sender": row[2],
+                "sender_name": row[3],
+                "date": row[4].strftime("%H:%M")
+            } for row in rows
         ]
@@ -0,0 +1,216 @@
+"""수어 랜드마크 녹화/재생 서비스
+
+소켓으로 들어오는 랜드마크 프레임을 청크 단위 메모리 맵 파일에 기록하고,
+기록된 세션을 다시 읽어오는 기능 제공 (인식 부하/회귀 재현용)
+
+저장 구조 (LANDMARK_RECORD_DIR):
+    chunk_<pid>_000001.bin ...   프레임 레코드를 순서대로 이어 쓴 파일 (세션이 섞여 있음)
+                                 (워커 프로세스별로 따로 씀, 이름은 O_EXCL 로 선점)
+    index.jsonl            세션별 인덱스 (한 줄에 세션 하나)
+
+프레임 레코드:
+    session_no(uint32) | ts_us(int64) | count(uint16) | float32 * count
+
+세션 인덱스:
+    {"session_id", "session_no", "member_id", "started_at", "ended_at",
+     "frames", "chunks": [[파일명, 시작 오프셋, 끝 오프셋], ...],
+     "glosses": [[ts_us, gloss], ...]}
+"""
+import os
+import re
+import json
+import mmap
+import time
+import uuid
+import struct
+import logging
+from array import array
+
+from app.core.config import settings
+
+logger = logging.getLogger("landmark_recorder")
+
+RECORD_HEADER = struct.Struct("<IqH")
+INDEX_FILE = "index.jsonl"
+CHUNK_PATTERN = re.compile(r"^chunk_(?:\d+_)?(\d{6})\.bin$")
+
+
+class _Chunk:
+    """미리 크기를 잡아둔 메모리 맵 청크 파일"""
+
+    def __init__(self, path: str, size: int):
+        self.name = os.path.basename(path)
+        self.path = path
+        self.size = size
+        self.pos = 0
+        self._file = open(path, "x+b")     # 이미 있으면 FileExistsError (다른 워커와 충돌 방지)
+        self._file.truncate(size)
+        self._map = mmap.mmap(self._file.fileno(), size)
+
+    def remaining(self) -> int:
+        return self.size - self.pos
+
+    def write(self, data: bytes) -> int:
+        start = self.pos
+        self._map[start:start + len(data)] = data
+        self.pos += len(data)
+        return start
+
+    def close(self):
+        """사용한 만큼만 남기고 닫기"""
+        self._map.flush()
+        self._map.close()
+        self._file.truncate(self.pos)
+        self._file.close()
+
+
+class LandmarkRecorder:
+    """연결(sid)별 랜드마크 세션 녹화기
+
+    프레임 기록은 메모리 맵 복사뿐이라 이벤트 루프에서 바로 호출해도 됨
+    """
+
+    def __init__(self, directory: str, chunk_bytes: int):
+        self.directory = directory
+        self.chunk_bytes = chunk_bytes
+        self.sessions = {}      # sid -> 세션 인덱스 dict
+        self._next_session_no = 1
+        self._chunk = None
+
+        os.makedirs(directory, exist_ok=True)
+        self._chunk_no = max(
+            [int(m.group(1)) for m in map(CHUNK_PATTERN.match, os.listdir(directory)) if m],
+            default=0
+        )
+
+    def _open_chunk(self):
+        if self._chunk:
+            self._chunk.close()
+            self._chunk = None
+        while True:
+            self._chunk_no += 1
+            path = os.path.join(self.directory, f"chunk_{os.getpid()}_{self._chunk_no:06d}.bin")
+            try:
+                self._chunk = _Chunk(path, self.chunk_bytes)
+                break
+            except FileExistsError:
+                continue
+        # 청크가 바뀌면 진행 중인 세션마다 새 구간 시작
+        for session in self.sessions.values():
+            session["chunks"].append([self._chunk.name, self._chunk.pos, self._chunk.pos])
+
+    def start_session(self, sid: str, member_id: str = None) -> dict:
+        """세션 시작 (이미 진행 중이면 그대로 반환)"""
+        if sid in self.sessions:
+            return self.sessions[sid]
+
+        if self._chunk is None:
+            self._open_chunk()
+
+        session = {
+            "session_id": uuid.uuid4().hex,
+            "session_no": self._next_session_no,
+            "member_id": member_id,
+            "started_at": time.time(),
+            "ended_at": None,
+            "frames": 0,
+            "chunks": [[self._chunk.name, self._chunk.pos, self._chunk.pos]],
+            "glosses": [],
+        }
+        self._next_session_no += 1
+        self.sessions[sid] = session
+        return session
+
+    def record_frame(self, sid: str, landmarks: list, member_id: str = None):
+        """프레임 하나 기록"""
+        session = self.start_session(sid, member_id)
+        values = array("f", landmarks)
+        data = RECORD_HEADER.pack(session["session_no"], time.time_ns() // 1000, len(values)) + values.tobytes()
+
+        if len(data) > self._chunk.remaining():
+            self._open_chunk()
+
+        self._chunk.write(data)
+        session["chunks"][-1][2] = self._chunk.pos
+        session["frames"] += 1
+
+    def record_gloss(self, sid: str, gloss: str):
+        """세션에 인식 결과(글로스) 기록"""
+        session = self.sessions.get(sid)
+        if session:
+            session["glosses"].append([time.time_ns() // 1000, gloss])
+
+    def end_session(self, sid: str):
+        """세션 종료 + 인덱스 기록 (프레임이 없으면 버림)"""
+        session = self.sessions.pop(sid, None)
+        if not session or not session["frames"]:
+            return None
+
+        session["ended_at"] = time.time()
+        session["chunks"] = [c for c in session["chunks"] if c[2] > c[1]]
+        with open(os.path.join(self.directory, INDEX_FILE), "a", encoding="utf-8") as f:
+            f.write(json.dumps(session, ensure_ascii=False) + "\n")
+
+        logger.info(f"🎞️ [녹화] 세션 저장 {session['session_id']} | {session['frames']} 프레임")
+        return session
+
+    def close(self):
+        """진행 중 세션 모두 종료 후 청크 닫기"""
+        for sid in list(self.sessions):
+            self.end_session(sid)
+        if self._chunk:
+            self._chunk.close()
+            self._chunk = None
+
+
+def load_sessions(directory: str) -> list:
+    """녹화된 세션 인덱스 목록"""
+    path = os.path.join(directory, INDEX_FILE)
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def iter_frames(directory: str, session: dict):
+    """세션 프레임을 순서대로 읽기
+
+    Yields:
+        tuple: (ts_us, [float, ...])
+    """
+    for chunk_name, start, end in session["chunks"]:
+        with open(os.path.join(directory, chunk_name), "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                pos = start
+                while pos < end:
+                    session_no, ts_us, count = RECORD_HEADER.unpack_from(data, pos)
+                    pos += RECORD_HEADER.size
+                    if session_no == session["session_no"]:
+                        values = array("f")
+                        values.frombytes(data[pos:pos + count * 4])
+                        yield ts_us, values.tolist()
+                    pos += count * 4
+
+
+_recorder = None
+
+
+def close_recorder():
+    """녹화기 정리 (서버 종료 시 호출 - 진행 중 세션 인덱스 기록 + 청크 크기 정리)"""
+    global _recorder
+    if _recorder is not None:
+        _recorder.close()
+        _recorder = None
+
+
+def get_recorder():
+    """설정에서 녹화가 켜져 있을 때만 녹화기 반환 (없으면 None)"""
+    global _recorder
+    if not settings.LANDMARK_RECORD_ENABLED:
+        return None
+    if _recorder is None:
+        _recorder = LandmarkRecorder(
+            settings.LANDMARK_RECORD_PATH,
+            settings.LANDMARK_CHUNK_MB * 1024 * 1024
+        )
+    return _recorder
@@ -0,0 +1,328 @@
+"""이벤트 아웃박스 서비스
+
+업무 트랜잭션 안에서 이벤트를 event_outbox 에 기록하고,
+릴레이가 배치로 추가 전용(append-only) 이벤트 로그에 발행하는 기능 제공
+
+- 전달 보장: at-least-once (발행 후 publish_date 기록 전에 죽으면 재발행)
+- 이벤트 로그: Redis Streams (운영) / 로컬 파일 (테스트·개발), EVENT_LOG_BACKEND 로 선택
+- 소비자는 그룹별 오프셋을 커밋하며 읽음 (커밋 전 중단 시 재전달)
+
+실행:
+    python -m app.services.outbox relay              # 아웃박스 -> 이벤트 로그 발행
+    python -m app.services.outbox tail <group>       # 이벤트 로그 소비 (출력만)
+    python -m app.services.outbox purge [days]       # 발행 완료 이벤트 정리 (기본 7일 보관)
+"""
+import os
+import sys
+import json
+import time
+import logging
+from sqlalchemy.orm import Session
+from sqlalchemy import text
+
+from app.core.config import settings
+
+logger = logging.getLogger("outbox")
+
+# 이벤트 종류
+TALK_CREATED = "talk.created"
+TALK_ROOM_CREATED = "talk_room.created"
+SIGN_SESSION_ENDED = "sign_session.ended"
+
+
+class OutboxService:
+    """아웃박스 기록/발행 비즈니스 로직 처리"""
+
+    @staticmethod
+    def add_event(db: Session, event_type: str, aggregate_id, payload: dict):
+        """이벤트 기록 (커밋하지 않음 - 호출한 쪽 트랜잭션과 함께 커밋)"""
+        insert_sql = text("""
+            INSERT INTO multicampus_schema.event_outbox (event_type, aggregate_id, payload)
+            VALUES (:type, :aggregate_id, CAST(:payload AS JSONB))
+        """)
+        db.execute(insert_sql, {
+            "type": event_type,
+            "aggregate_id": str(aggregate_id),
+            "payload": json.dumps(payload, ensure_ascii=False, default=str)
+        })
+
+    @staticmethod
+    def publish_batch(db: Session, event_log, batch_size: int = 500) -> int:
+        """미발행 이벤트 한 배치 발행
+
+        SKIP LOCKED 로 잠가서 릴레이를 여러 개 띄워도 같은 행을 나눠 갖지 않음
+
+        Returns:
+            int: 발행한 이벤트 수
+        """
+        select_sql = text("""
+            SELECT event_id, event_type, aggregate_id, payload, create_date
+            FROM multicampus_schema.event_outbox
+            WHERE publish_date IS NULL
+            ORDER BY event_id
+            LIMIT :n
+            FOR UPDATE SKIP LOCKED
+        """)
+        mark_sql = text("""
+            UPDATE multicampus_schema.event_outbox
+            SET publish_date = CURRENT_TIMESTAMP AT TIME ZONE 'Asia/Seoul'
+            WHERE event_id = ANY(:ids)
+        """)
+
+        try:
+            rows = db.execute(select_sql, {"n": batch_size}).fetchall()
+            if not rows:
+                db.rollback()
+                return 0
+
+            events = [
+                {
+                    "event_id": row[0],
+                    "event_type": row[1],
+                    "aggregate_id": row[2],
+                    "payload": row[3],
+                    "create_date": row[4].isoformat()
+                } for row in rows
+            ]
+            event_log.append(events)
+
+            db.execute(mark_sql, {"ids": [row[0] for row in rows]})
+            db.commit()
+            return len(events)
+        except Exception as e:
+            db.rollback()
+            raise e
+
+    @staticmethod
+    def purge_published(db: Session, keep_days: int = 7) -> int:
+        """발행 완료 후 keep_days 지난 이벤트 삭제
+
+        Returns:
+            int: 삭제한 행 수
+        """
+        delete_sql = text("""
+            DELETE FROM multicampus_schema.event_outbox
+            WHERE publish_date < CURRENT_TIMESTAMP AT TIME ZONE 'Asia/Seoul'
+                                 - make_interval(days => :days)
+        """)
+        try:
+            deleted = db.execute(delete_sql, {"days": keep_days}).rowcount
+            db.commit()
+            return deleted
+        except Exception as e:
+            db.rollback()
+            raise e
+
+
+class FileEventLog:
+    """로컬 파일 이벤트 로그 (테스트/개발용)
+
+    events.jsonl 에 한 줄씩 추가, 오프셋 = 줄 번호(1부터)
+    소비자 그룹 오프셋은 offsets.json 에 저장
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.log_path = os.path.join(directory, "events.jsonl")
+        self.offsets_path = os.path.join(directory, "offsets.json")
+        os.makedirs(directory, exist_ok=True)
+
+    def append(self, events: list):
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            for event in events:
+                f.write(json.dumps(event, ensure_ascii=False, default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _load_offsets(self) -> dict:
+        if not os.path.exists(self.offsets_path):
+            return {}
+        with open(self.offsets_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def read(self, group: str, consumer: str = None, count: int = 100) -> list:
+        """커밋된 오프셋 이후 이벤트 읽기
+
+        Returns:
+            list: [(오프셋, 이벤트), ...]
+        """
+        committed = int(self._load_offsets().get(group, 0))
+        if not os.path.exists(self.log_path):
+            return []
+
+        results = []
+        with open(self.log_path, "r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, start=1):
+                if line_no <= committed:
+                    continue
+                results.append((line_no, json.loads(line)))
+                if len(results) >= count:
+                    break
+        return results
+
+    def ack(self, group: str, offsets: list):
+        """처리 완료 오프셋 커밋 (가장 큰 값까지)"""
+        if not offsets:
+            return
+        data = self._load_offsets()
+        data[group] = max(int(data.get(group, 0)), max(int(o) for o in offsets))
+
+        tmp_path = self.offsets_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.offsets_path)
+
+
+class RedisStreamLog:
+    """Redis Streams 이벤트 로그 (운영용)
+
+    오프셋 = 스트림 엔트리 ID, 소비자 그룹 오프셋은 Redis 가 관리 (XREADGROUP/XACK)
+    """
+
+    def __init__(self, url: str, stream: str, maxlen: int = None):
+        import redis
+
+        self.client = redis.Redis.from_url(url)
+        self.stream = stream
+        self.maxlen = maxlen
+        self._groups = set()
+
+    def append(self, events: list):
+        pipe = self.client.pipeline(transaction=False)
+        for event in events:
+            pipe.xadd(
+                self.stream,
+                {"event": json.dumps(event, ensure_ascii=False, default=str)},
+                maxlen=self.maxlen,
+                approximate=True
+            )
+        pipe.execute()
+
+    def _ensure_group(self, group: str):
+        if group in self._groups:
+            return
+        import redis
+
+        try:
+            self.client.xgroup_create(self.stream, group, id="0", mkstream=True)
+        except redis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._groups.add(group)
+
+    def read(self, group: str, consumer: str = "default", count: int = 100) -> list:
+        """미확인(재전달) 이벤트 먼저, 없으면 새 이벤트 읽기
+
+        Returns:
+            list: [(엔트리 ID, 이벤트), ...]
+        """
+        self._ensure_group(group)
+        for start in ("0", ">"):
+            response = self.client.xreadgroup(group, consumer, {self.stream: start}, count=count)
+            entries = response[0][1] if response else []
+
+            # MAXLEN 으로 잘려나간 미확인 엔트리는 내용이 없으므로 바로 확인 처리
+            trimmed = [entry_id for entry_id, fields in entries if not fields]
+            if trimmed:
+                self.client.xack(self.stream, group, *trimmed)
+
+            events = [
+                (entry_id.decode(), json.loads(fields[b"event"]))
+                for entry_id, fields in entries if fields
+            ]
+            if events:
+                return events
+        return []
+
+    def ack(self, group: str, offsets: list):
+        if offsets:
+            self.client.xack(self.stream, group, *offsets)
+
+
+def get_event_log():
+    """설정에 맞는 이벤트 로그 생성"""
+    if settings.EVENT_LOG_BACKEND == "redis":
+        return RedisStreamLog(settings.REDIS_URL, settings.EVENT_STREAM, settings.EVENT_STREAM_MAXLEN)
+    return FileEventLog(settings.EVENT_LOG_PATH)
+
+
+def consume(event_log, group: str, handler, consumer: str = "default", count: int = 100, poll_interval: float = 1.0):
+    """이벤트 로그 소비 루프 (처리 후 오프셋 커밋 - at-least-once)
+
+    handler 는 같은 이벤트를 두 번 받아도 안전해야 함 (event_id 로 중복 제거)
+    """
+    while True:
+        batch = event_log.read(group, consumer, count)
+        if not batch:
+            time.sleep(poll_interval)
+            continue
+        for _, event in batch:
+            handler(event)
+        event_log.ack(group, [offset for offset, _ in batch])
+
+
+def purge(keep_days: int = 7) -> int:
+    """발행 완료 이벤트 정리 (릴레이 주기 작업 / CLI 공용)"""
+    from app.core.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        deleted = OutboxService.purge_published(db, keep_days)
+    finally:
+        db.close()
+    if deleted:
+        logger.info(f"🧹 [아웃박스] 발행 완료 이벤트 {deleted}건 삭제 ({keep_days}일 경과)")
+    return deleted
+
+
+def run_relay(
+    batch_size: int = 500,
+    poll_interval: float = 0.5,
+    purge_interval: float = 3600,
+    keep_days: int = 7
+):
+    """아웃박스 릴레이 (미발행 이벤트가 없을 때만 대기)
+
+    purge_interval 초마다 keep_days 지난 발행 완료 이벤트를 삭제 (테이블 무한 증가 방지)
+    """
+    from app.core.database import SessionLocal
+
+    event_log = get_event_log()
+    logger.info(f"📤 [릴레이] 시작 ({type(event_log).__name__})")
+    next_purge = time.monotonic()
+    while True:
+        if time.monotonic() >= next_purge:
+            try:
+                purge(keep_days)
+            except Exception as e:
+                logger.error(f"❌ [릴레이] 정리 실패: {e}")
+            next_purge = time.monotonic() + purge_interval
+
+        db = SessionLocal()
+        try:
+            published = OutboxService.publish_batch(db, event_log, batch_size)
+        except Exception as e:
+            logger.error(f"❌ [릴레이] 발행 실패: {e}")
+            published = 0
+        finally:
+            db.close()
+
+        if published:
+            logger.info(f"📤 [릴레이] {published}건 발행")
+        if published < batch_size:
+            time.sleep(poll_interval)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    command = sys.argv[1] if len(sys.argv) > 1 else "relay"
+
+    if command == "relay":
+        run_relay()
+    elif command == "tail":
+        group = sys.argv[2] if len(sys.argv) > 2 else "tail"
+        consume(get_event_log(), group, lambda event: print(json.dumps(event, ensure_ascii=False)))
+    elif command == "purge":
+        purge(int(sys.argv[2]) if len(sys.argv) > 2 else 7)
+    else:
+        print(f"알 수 없는 명령: {command} (relay | tail <group> | purge [days])")
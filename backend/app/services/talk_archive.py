@@ -0,0 +1,362 @@
+"""대화 아카이브 서비스
+
+보관 기간이 지난 talk 월별 파티션을 압축 컬럼 파일로 옮기고,
+아카이브된 대화를 다시 읽어오는 기능 제공
+
+파일 형식 (.tca):
+    MAGIC | 행 그룹(컬럼별 zlib 블록)... | 헤더(JSON) | 헤더 오프셋(uint64) | MAGIC
+
+    - 행은 (talk_room_id, talk_seq) 순으로 정렬되어 저장
+    - 정수 컬럼은 델타 인코딩 후 압축 (정렬된 방 번호/순번은 거의 0과 1)
+    - 헤더의 rooms 에 방별 행 범위가 있어 필요한 행 그룹만 압축 해제
+
+실행 (정기 작업):
+    python -m app.services.talk_archive
+"""
+import os
+import json
+import zlib
+import struct
+import logging
+from array import array
+from datetime import datetime, timedelta
+from sqlalchemy.orm import Session
+from sqlalchemy import text
+
+from app.core.config import settings
+
+logger = logging.getLogger("talk_archive")
+
+MAGIC = b"TCA1"
+ROW_GROUP_SIZE = 8192
+MANIFEST_FILE = "manifest.json"
+
+# 컬럼 정의 (이름, 타입)
+COLUMNS = [
+    ("talk_room_id", "int"),
+    ("talk_seq", "int"),
+    ("member_no", "int"),
+    ("talk_date", "int"),      # epoch 마이크로초
+    ("message", "str"),
+    ("create_user", "str"),
+]
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _to_micros(value: datetime) -> int:
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+def _from_micros(value: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def _encode_ints(values: list) -> bytes:
+    """델타 인코딩 + 압축"""
+    deltas = array("q", [0] * len(values))
+    prev = 0
+    for i, v in enumerate(values):
+        deltas[i] = v - prev
+        prev = v
+    return zlib.compress(deltas.tobytes(), 6)
+
+
+def _decode_ints(blob: bytes) -> list:
+    deltas = array("q")
+    deltas.frombytes(zlib.decompress(blob))
+    values = []
+    acc = 0
+    for d in deltas:
+        acc += d
+        values.append(acc)
+    return values
+
+
+def _encode_strs(values: list) -> bytes:
+    """길이 배열 + 이어붙인 UTF-8 바이트를 함께 압축"""
+    encoded = [(v or "").encode("utf-8") for v in values]
+    lengths = array("I", [len(b) for b in encoded])
+    return zlib.compress(struct.pack("<I", len(lengths)) + lengths.tobytes() + b"".join(encoded), 6)
+
+
+def _decode_strs(blob: bytes) -> list:
+    raw = zlib.decompress(blob)
+    (count,) = struct.unpack_from("<I", raw, 0)
+    lengths = array("I")
+    lengths.frombytes(raw[4:4 + count * lengths.itemsize])
+    values = []
+    pos = 4 + count * lengths.itemsize
+    for n in lengths:
+        values.append(raw[pos:pos + n].decode("utf-8"))
+        pos += n
+    return values
+
+
+def write_archive_file(path: str, partition: str, rows) -> dict:
+    """정렬된 행 목록을 아카이브 파일로 기록
+
+    Args:
+        rows: (talk_room_id, talk_seq, member_no, talk_date, message, create_user)
+              를 (talk_room_id, talk_seq) 순으로 내보내는 iterable
+
+    Returns:
+        dict: 파일 헤더 (rooms, groups 등)
+    """
+    header = {"partition": partition, "rows": 0, "rooms": {}, "groups": []}
+    tmp_path = path + ".tmp"
+
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        buffer = []
+
+        def flush():
+            if not buffer:
+                return
+            group = {"start": header["rows"], "rows": len(buffer), "blocks": []}
+            for idx, (_, kind) in enumerate(COLUMNS):
+                values = [row[idx] for row in buffer]
+                blob = _encode_ints(values) if kind == "int" else _encode_strs(values)
+                group["blocks"].append([f.tell(), len(blob)])
+                f.write(blob)
+            header["groups"].append(group)
+            header["rows"] += len(buffer)
+            buffer.clear()
+
+        for row in rows:
+            room_id, seq = int(row[0]), int(row[1])
+            row_no = header["rows"] + len(buffer)
+            room = header["rooms"].setdefault(str(room_id), [row_no, row_no, seq, seq])
+            room[1] = row_no + 1
+            room[3] = seq
+            buffer.append((room_id, seq, int(row[2]), _to_micros(row[3]), row[4], row[5]))
+            if len(buffer) >= ROW_GROUP_SIZE:
+                flush()
+        flush()
+
+        header_offset = f.tell()
+        f.write(json.dumps(header).encode("utf-8"))
+        f.write(struct.pack("<Q", header_offset))
+        f.write(MAGIC)
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(tmp_path, path)
+    return header
+
+
+def read_archive_header(f) -> dict:
+    f.seek(-12, os.SEEK_END)
+    (header_offset,) = struct.unpack("<Q", f.read(8))
+    if f.read(4) != MAGIC:
+        raise ValueError("손상된 아카이브 파일입니다.")
+    end = f.seek(0, os.SEEK_END) - 12
+    f.seek(header_offset)
+    return json.loads(f.read(end - header_offset))
+
+
+def read_archive_room(path: str, room_id: int, since: int = 0) -> list:
+    """아카이브 파일에서 특정 방의 메시지 읽기
+
+    Returns:
+        list: [(talk_seq, member_no, talk_date, message), ...] (순번 오름차순)
+    """
+    with open(path, "rb") as f:
+        header = read_archive_header(f)
+        room = header["rooms"].get(str(room_id))
+        if not room or room[3] <= since:
+            return []
+
+        first, last = room[0], room[1]
+        results = []
+        for group in header["groups"]:
+            g_start, g_end = group["start"], group["start"] + group["rows"]
+            if g_end <= first or g_start >= last:
+                continue
+
+            columns = []
+            for (_, kind), (offset, size) in zip(COLUMNS, group["blocks"]):
+                f.seek(offset)
+                blob = f.read(size)
+                columns.append(_decode_ints(blob) if kind == "int" else _decode_strs(blob))
+
+            lo, hi = max(first, g_start) - g_start, min(last, g_end) - g_start
+            for i in range(lo, hi):
+                seq = columns[1][i]
+                if seq > since:
+                    results.append((seq, columns[2][i], _from_micros(columns[3][i]), columns[4][i]))
+
+        return results
+
+
+class TalkArchiveService:
+    """대화 아카이브 관련 비즈니스 로직 처리"""
+
+    _manifest_cache = {"mtime": None, "data": None}
+
+    @staticmethod
+    def _manifest_path() -> str:
+        return os.path.join(settings.TALK_ARCHIVE_PATH, MANIFEST_FILE)
+
+    @staticmethod
+    def load_manifest() -> dict:
+        """아카이브 목록 조회 (파일 변경 시에만 다시 읽음)
+
+        Returns:
+            dict: {"partitions": {파티션명: {"file", "rooms": {방번호: 최대 순번}}}}
+        """
+        path = TalkArchiveService._manifest_path()
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            return {"partitions": {}}
+
+        cache = TalkArchiveService._manifest_cache
+        if cache["mtime"] != mtime:
+            with open(path, "r", encoding="utf-8") as f:
+                cache["data"] = json.load(f)
+            cache["mtime"] = mtime
+        return cache["data"]
+
+    @staticmethod
+    def _save_manifest(manifest: dict):
+        path = TalkArchiveService._manifest_path()
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def get_room_messages(room_id: int, since: int = 0) -> list:
+        """아카이브된 방 메시지 조회
+
+        manifest 의 방별 최대 순번으로 since 이후가 없는 파일은 열지 않음
+
+        Returns:
+            list: [(talk_seq, member_no, talk_date, message), ...] (순번 오름차순)
+        """
+        manifest = TalkArchiveService.load_manifest()
+        results = []
+        for info in manifest["partitions"].values():
+            max_seq = info["rooms"].get(str(room_id))
+            if max_seq is None or max_seq <= since:
+                continue
+            path = os.path.join(settings.TALK_ARCHIVE_PATH, info["file"])
+            results.extend(read_archive_room(path, room_id, since))
+
+        results.sort(key=lambda row: row[0])
+        return results
+
+    @staticmethod
+    def ensure_partitions(db: Session, months_ahead: int = 3):
+        """이번 달부터 months_ahead 개월 뒤까지 파티션 미리 생성
+
+        DEFAULT 파티션에 들어간 해당 월 데이터는 ensure_talk_partition 이 옮김
+        """
+        sql = text("""
+            SELECT multicampus_schema.ensure_talk_partition(
+                (date_trunc('month', CURRENT_TIMESTAMP AT TIME ZONE 'Asia/Seoul')
+                 + make_interval(months => :n))::DATE
+            )
+        """)
+        for n in range(months_ahead + 1):
+            db.execute(sql, {"n": n})
+        db.commit()
+
+    @staticmethod
+    def find_expired_partitions(db: Session, hot_months: int):
+        """보관 기간이 지난 파티션 목록
+
+        Returns:
+            list: 파티션 이름 (오래된 순)
+        """
+        sql = text("""
+            SELECT C.relname
+            FROM pg_inherits I
+            JOIN pg_class C ON C.oid = I.inhrelid
+            JOIN pg_class P ON P.oid = I.inhparent
+            JOIN pg_namespace N ON N.oid = P.relnamespace
+            WHERE N.nspname = 'multicampus_schema'
+              AND P.relname = 'talk'
+              AND C.relname ~ '^talk_p[0-9]{6}$'
+              AND to_date(substring(C.relname from 7), 'YYYYMM')
+                  < date_trunc('month', CURRENT_TIMESTAMP AT TIME ZONE 'Asia/Seoul')
+                    - make_interval(months => :hot)
+            ORDER BY C.relname
+        """)
+        return [row[0] for row in db.execute(sql, {"hot": hot_months}).fetchall()]
+
+    @staticmethod
+    def archive_partition(db: Session, partition: str) -> int:
+        """파티션 하나를 아카이브 파일로 옮기고 DB에서 제거
+
+        1. 파티션 분리 (DETACH) - 이후 읽기는 아카이브로
+        2. 정렬된 행을 파일로 기록 + manifest 갱신
+        3. 분리된 테이블 삭제
+
+        Returns:
+            int: 아카이브된 행 수
+        """
+        os.makedirs(settings.TALK_ARCHIVE_PATH, exist_ok=True)
+        file_name = f"{partition}.tca"
+        path = os.path.join(settings.TALK_ARCHIVE_PATH, file_name)
+
+        select_sql = text(f"""
+            SELECT talk_room_id, talk_seq, member_no, talk_date, message, create_user
+            FROM multicampus_schema.{partition}
+            ORDER BY talk_room_id, talk_seq
+        """)
+
+        try:
+            # 파일 기록 (서버 측 커서로 스트리밍)
+            rows = db.execute(select_sql, execution_options={"stream_results": True, "yield_per": ROW_GROUP_SIZE})
+            header = write_archive_file(path, partition, rows)
+
+            manifest = TalkArchiveService.load_manifest()
+            manifest = {"partitions": dict(manifest["partitions"])}
+            manifest["partitions"][partition] = {
+                "file": file_name,
+                "rows": header["rows"],
+                "rooms": {room: info[3] for room, info in header["rooms"].items()},
+            }
+            TalkArchiveService._save_manifest(manifest)
+
+            # DB 에서 제거 (manifest 기록 후이므로 읽기 누락 없음)
+            db.execute(text(f"ALTER TABLE multicampus_schema.talk DETACH PARTITION multicampus_schema.{partition}"))
+            db.execute(text(f"DROP TABLE multicampus_schema.{partition}"))
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            raise e
+
+        logger.info(f"📦 [아카이브] {partition} -> {file_name} ({header['rows']}건)")
+        return header["rows"]
+
+    @staticmethod
+    def run_retention(db: Session, hot_months: int = None) -> dict:
+        """보관 정책 실행 (파티션 생성 + 만료 파티션 아카이브)
+
+        Returns:
+            dict: {파티션명: 아카이브된 행 수}
+        """
+        hot_months = settings.TALK_HOT_MONTHS if hot_months is None else hot_months
+        TalkArchiveService.ensure_partitions(db)
+
+        archived = {}
+        for partition in TalkArchiveService.find_expired_partitions(db, hot_months):
+            archived[partition] = TalkArchiveService.archive_partition(db, partition)
+        return archived
+
+
+if __name__ == "__main__":
+    from app.core.database import SessionLocal
+
+    logging.basicConfig(level=logging.INFO)
+    db = SessionLocal()
+    try:
+        result = TalkArchiveService.run_retention(db)
+        logger.info(f"✅ [아카이브] 완료: {result or '대상 없음'}")
+    finally:
+        db.close()
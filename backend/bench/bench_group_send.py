@@ -0,0 +1,108 @@
+"""그룹 채팅 전송 지연 벤치마크
+
+그룹 크기별로 참여자 수만큼 소켓 클라이언트를 접속시킨 뒤
+send_message 부터 마지막 참여자가 receive_message 를 받을 때까지의 시간을 측정
+(반드시 테스트용 DB/서버에서 실행할 것 - 벤치마크용 회원/채팅방이 추가됨)
+
+실행 (서버 실행 중, 소켓 클라이언트용 aiohttp 필요):
+    cd backend
+    python -m bench.bench_group_send --url http://localhost:8000 --sizes 2,10,50,200
+"""
+import argparse
+import asyncio
+import time
+import socketio
+from sqlalchemy import text
+
+from app.core.database import SessionLocal
+from app.services.chat_service import ChatService
+from bench.stats import latency_summary
+
+BENCH_PREFIX = "bench_g_"
+
+
+def prepare_room(size: int) -> tuple:
+    """벤치마크 회원 size 명 + 그룹 방 생성
+
+    Returns:
+        tuple: (방 번호, 회원 아이디 목록)
+    """
+    member_ids = [f"{BENCH_PREFIX}{i}" for i in range(size)]
+    db = SessionLocal()
+    try:
+        db.execute(text("""
+            INSERT INTO multicampus_schema.member (
+                member_id, passwd, full_name, mobile_phone,
+                e_mail_address, deaf_muteness_section_code, create_user
+            )
+            SELECT id, 'x', '벤치마크', '010-0000-0000', 'bench@example.com', TRUE, id
+            FROM unnest(CAST(:ids AS VARCHAR[])) AS id
+            ON CONFLICT (member_id) DO NOTHING
+        """), {"ids": member_ids})
+        db.commit()
+
+        room = ChatService.create_group_room(db, member_ids[0], member_ids[1:], f"bench {size}")
+        return room["room_id"], member_ids
+    finally:
+        db.close()
+
+
+async def bench_size(url: str, size: int, messages: int) -> list:
+    room_id, member_ids = prepare_room(size)
+
+    received = {}
+    done = {}
+
+    def make_handler():
+        async def on_receive(data):
+            seq_msg = data.get("message")
+            if seq_msg in received:
+                received[seq_msg] += 1
+                if received[seq_msg] == size:
+                    done[seq_msg].set_result(time.perf_counter())
+        return on_receive
+
+    clients = []
+    for member_id in member_ids:
+        client = socketio.AsyncClient()
+        client.on("receive_message", make_handler())
+        await client.connect(url, transports=["websocket"])
+        await client.emit("join_room", {"room_id": room_id, "username": member_id})
+        clients.append(client)
+    await asyncio.sleep(1)
+
+    latencies = []
+    loop = asyncio.get_running_loop()
+    for i in range(messages):
+        msg = f"bench {size} #{i}"
+        received[msg] = 0
+        done[msg] = loop.create_future()
+
+        t0 = time.perf_counter()
+        await clients[0].emit("send_message", {
+            "room_id": room_id,
+            "username": member_ids[0],
+            "message": msg
+        })
+        t1 = await asyncio.wait_for(done[msg], timeout=10)
+        latencies.append(t1 - t0)
+
+    for client in clients:
+        await client.disconnect()
+    return latencies
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="그룹 채팅 전송 지연 벤치마크")
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--sizes", default="2,10,50,200")
+    parser.add_argument("--messages", type=int, default=200)
+    args = parser.parse_args()
+
+    for size in [int(s) for s in args.sizes.split(",")]:
+        times = await bench_size(args.url, size, args.messages)
+        print(f"그룹 {size:>4}명  {latency_summary(times)}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,178 @@
+"""talk 저장소 벤치마크
+
+대량의 합성 메시지를 채운 뒤 메시지 저장 지연과 최근 대화 조회 지연을 측정
+(반드시 테스트용 DB 에서 실행할 것 - 벤치마크용 채팅방/메시지가 추가됨)
+
+실행:
+    cd backend
+    python -m bench.bench_talk_storage --rows 100000000 --rooms 200000 --months 24
+    python -m bench.bench_talk_storage --skip-fill        # 이미 채운 데이터로 측정만
+"""
+import argparse
+import random
+import time
+from sqlalchemy import text
+
+from app.core.database import SessionLocal
+from app.api.sockets import save_message_sync
+from app.services.chat_service import ChatService
+from app.services.talk_archive import TalkArchiveService
+from bench.stats import latency_summary
+
+BENCH_USER = "bench_user"
+FILL_BATCH = 1_000_000
+
+
+def report(title: str, samples: list):
+    print(f"{title:<24} {latency_summary(samples)}")
+
+
+def get_bench_member(db):
+    """벤치마크 발신자 (없으면 생성)"""
+    sql = text("SELECT member_no FROM multicampus_schema.member WHERE member_id = :id")
+    member_no = db.execute(sql, {"id": BENCH_USER}).scalar()
+    if member_no:
+        return member_no
+
+    db.execute(text("""
+        INSERT INTO multicampus_schema.member (
+            member_id, passwd, full_name, mobile_phone,
+            e_mail_address, deaf_muteness_section_code, create_user
+        ) VALUES (:id, 'x', '벤치마크', '010-0000-0000', 'bench@example.com', TRUE, :id)
+    """), {"id": BENCH_USER})
+    db.commit()
+    return db.execute(sql, {"id": BENCH_USER}).scalar()
+
+
+def create_rooms(db, member_no: int, count: int) -> list:
+    sql = text("""
+        INSERT INTO multicampus_schema.talk_room (talk_room_id, create_user)
+        SELECT nextval('multicampus_schema.talk_room_id_s'), :c
+        FROM generate_series(1, :n)
+        RETURNING talk_room_id
+    """)
+    room_ids = [row[0] for row in db.execute(sql, {"c": BENCH_USER, "n": count})]
+    db.execute(text("""
+        INSERT INTO multicampus_schema.talk_room_member (talk_room_id, member_no, create_user)
+        SELECT r_id, :m, :c FROM unnest(CAST(:ids AS INTEGER[])) AS r_id
+    """), {"m": member_no, "c": BENCH_USER, "ids": room_ids})
+    db.commit()
+    return room_ids
+
+
+def fill(db, member_no: int, room_ids: list, rows: int, months: int):
+    """generate_series 로 메시지를 채움 (방마다 순번 1..k, 최근 months 개월에 고르게 분포)"""
+    per_room = max(1, rows // len(room_ids))
+    first_room, last_room = room_ids[0], room_ids[-1]
+
+    for m in range(months + 1):
+        db.execute(text("""
+            SELECT multicampus_schema.ensure_talk_partition(
+                (date_trunc('month', CURRENT_TIMESTAMP AT TIME ZONE 'Asia/Seoul')
+                 - make_interval(months => :m))::DATE
+            )
+        """), {"m": m})
+    db.commit()
+
+    span_seconds = months * 30 * 86400
+    fill_sql = text("""
+        INSERT INTO multicampus_schema.talk (
+            talk_room_id, talk_seq, member_no, talk_date, message, create_user
+        )
+        SELECT r.id, s.seq, :m_no,
+               (CURRENT_TIMESTAMP AT TIME ZONE 'Asia/Seoul')
+                   - make_interval(secs => :span * (1 - s.seq::float / :per_room)),
+               '벤치마크 메시지 ' || s.seq, :c
+        FROM generate_series(:r_from, :r_to) AS r(id),
+             generate_series(:s_from, :s_to) AS s(seq)
+    """)
+
+    rooms_per_batch = max(1, FILL_BATCH // per_room)
+    started = time.perf_counter()
+    inserted = 0
+    for r_from in range(first_room, last_room + 1, rooms_per_batch):
+        r_to = min(last_room, r_from + rooms_per_batch - 1)
+        db.execute(fill_sql, {
+            "m_no": member_no, "c": BENCH_USER, "span": span_seconds, "per_room": per_room,
+            "r_from": r_from, "r_to": r_to, "s_from": 1, "s_to": per_room,
+        })
+        db.commit()
+        inserted += (r_to - r_from + 1) * per_room
+        elapsed = time.perf_counter() - started
+        print(f"  채움 {inserted:,} / {rows:,} 행 ({inserted / elapsed:,.0f} 행/초)")
+
+    db.execute(text("""
+        UPDATE multicampus_schema.talk_room
+        SET last_talk_seq = :per_room
+        WHERE talk_room_id BETWEEN :r_from AND :r_to
+    """), {"per_room": per_room, "r_from": first_room, "r_to": last_room})
+    db.commit()
+
+
+def bench(db, room_ids: list, samples: int, recent: int):
+    rng = random.Random(0)
+
+    insert_times = []
+    for i in range(samples):
+        room_id = rng.choice(room_ids)
+        t0 = time.perf_counter()
+        save_message_sync(room_id, BENCH_USER, f"측정 메시지 {i}")
+        insert_times.append(time.perf_counter() - t0)
+    report("메시지 저장", insert_times)
+
+    last_seq_sql = text("SELECT last_talk_seq FROM multicampus_schema.talk_room WHERE talk_room_id = :r")
+    history_times = []
+    for _ in range(samples):
+        room_id = rng.choice(room_ids)
+        last_seq = db.execute(last_seq_sql, {"r": room_id}).scalar()
+        t0 = time.perf_counter()
+        ChatService.get_chat_history(db, room_id, max(0, last_seq - recent))
+        history_times.append(time.perf_counter() - t0)
+    report(f"최근 {recent}건 조회", history_times)
+
+    # 아카이브 구간 조회 (가장 오래된 메시지부터)
+    archive_times = []
+    for _ in range(min(samples, 100)):
+        room_id = rng.choice(room_ids)
+        t0 = time.perf_counter()
+        TalkArchiveService.get_room_messages(room_id, 0)
+        archive_times.append(time.perf_counter() - t0)
+    report("아카이브 방 조회", archive_times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="talk 저장소 벤치마크")
+    parser.add_argument("--rows", type=int, default=100_000_000)
+    parser.add_argument("--rooms", type=int, default=200_000)
+    parser.add_argument("--months", type=int, default=24)
+    parser.add_argument("--samples", type=int, default=1000)
+    parser.add_argument("--recent", type=int, default=50)
+    parser.add_argument("--skip-fill", action="store_true")
+    parser.add_argument("--archive", action="store_true", help="측정 전 보관 정책 실행")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        member_no = get_bench_member(db)
+
+        if args.skip_fill:
+            room_ids = [row[0] for row in db.execute(text("""
+                SELECT talk_room_id FROM multicampus_schema.talk_room WHERE create_user = :c
+                ORDER BY talk_room_id
+            """), {"c": BENCH_USER})]
+        else:
+            room_ids = create_rooms(db, member_no, args.rooms)
+            fill(db, member_no, room_ids, args.rows, args.months)
+            db.execute(text("ANALYZE multicampus_schema.talk"))
+            db.commit()
+
+        if args.archive:
+            print(f"보관 정책 실행: {TalkArchiveService.run_retention(db)}")
+
+        bench(db, room_ids, args.samples, args.recent)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
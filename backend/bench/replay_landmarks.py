@@ -0,0 +1,103 @@
+"""녹화된 수어 랜드마크 세션 재생
+
+LandmarkRecorder 로 기록된 세션을 소켓 서버에 다시 흘려보내
+인식 파이프라인 부하를 재현 (세션마다 소켓 클라이언트 1개, 동시 재생)
+재생 연결은 관리자 토큰과 함께 replay 로 표시되어 서버에서 녹화/아웃박스 기록이 생략됨
+(토큰이 없거나 틀리면 일반 연결로 처리되어 재생분이 다시 녹화되고
+ sign_session.ended 이벤트가 분석 이벤트 로그로 발행되므로 반드시 지정)
+
+실행 (서버 실행 중, 소켓 클라이언트용 aiohttp 필요):
+    cd backend
+    python -m bench.replay_landmarks --url http://localhost:8000              # 실시간 (ADMIN_TOKEN 은 설정값 사용)
+    python -m bench.replay_landmarks --admin-token <토큰>                     # 다른 서버 대상
+    python -m bench.replay_landmarks --speed 4 --repeat 10                    # 4배속, 세션 10배
+    python -m bench.replay_landmarks --speed 0                                # 최대 속도
+"""
+import argparse
+import asyncio
+import time
+import socketio
+
+from app.core.config import settings
+from app.services.landmark_recorder import load_sessions, iter_frames
+
+
+async def replay_session(url: str, directory: str, session: dict, speed: float, admin_token: str) -> dict:
+    """세션 하나 재생
+
+    Returns:
+        dict: {"frames", "elapsed", "max_lag"} (lag: 예정 시각 대비 지연, 초)
+    """
+    client = socketio.AsyncClient()
+    await client.connect(url, transports=["websocket"], auth={"replay": True, "admin_token": admin_token})
+
+    frames = 0
+    max_lag = 0.0
+    first_ts = None
+    started = time.perf_counter()
+
+    for ts_us, landmarks in iter_frames(directory, session):
+        if first_ts is None:
+            first_ts = ts_us
+        if speed > 0:
+            due = started + (ts_us - first_ts) / 1_000_000 / speed
+            delay = due - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                max_lag = max(max_lag, -delay)
+        await client.emit("sign_landmarks", landmarks)
+        frames += 1
+
+    await client.emit("stop_sign")
+    elapsed = time.perf_counter() - started
+    await client.disconnect()
+    return {"frames": frames, "elapsed": elapsed, "max_lag": max_lag}
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="수어 랜드마크 세션 재생")
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--dir", default=settings.LANDMARK_RECORD_PATH, help="녹화 디렉터리")
+    parser.add_argument("--speed", type=float, default=1.0, help="재생 배속 (0 = 대기 없이 최대 속도)")
+    parser.add_argument("--member", help="특정 회원 세션만 재생")
+    parser.add_argument("--session", help="특정 세션(session_id)만 재생")
+    parser.add_argument("--limit", type=int, help="재생할 세션 수")
+    parser.add_argument("--repeat", type=int, default=1, help="세션을 몇 배로 복제해 동시 재생")
+    parser.add_argument("--admin-token", default=settings.ADMIN_TOKEN, help="재생 연결 표시용 관리자 토큰")
+    args = parser.parse_args()
+
+    if not args.admin_token:
+        print("관리자 토큰이 없습니다. (--admin-token 또는 ADMIN_TOKEN 설정)")
+        return
+
+    sessions = load_sessions(args.dir)
+    if args.member:
+        sessions = [s for s in sessions if s["member_id"] == args.member]
+    if args.session:
+        sessions = [s for s in sessions if s["session_id"] == args.session]
+    if args.limit:
+        sessions = sessions[:args.limit]
+    sessions = sessions * args.repeat
+
+    if not sessions:
+        print("재생할 세션이 없습니다.")
+        return
+
+    print(f"세션 {len(sessions)}개 재생 ({'최대 속도' if args.speed <= 0 else f'{args.speed}배속'})")
+    started = time.perf_counter()
+    results = await asyncio.gather(*[
+        replay_session(args.url, args.dir, session, args.speed, args.admin_token) for session in sessions
+    ])
+    elapsed = time.perf_counter() - started
+
+    total_frames = sum(r["frames"] for r in results)
+    print(
+        f"프레임 {total_frames:,}개 / {elapsed:.2f}초 "
+        f"({total_frames / elapsed:,.0f} 프레임/초) | "
+        f"최대 지연 {max(r['max_lag'] for r in results) * 1000:.1f}ms"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,270 @@
+"""대량 합성 데이터 생성기 (member / talk_room / talk_room_member / talk)
+
+부하 테스트용 데이터를 Postgres COPY 로 한꺼번에 적재
+- 비밀번호 해시는 DB에서 한 번만 계산해 모든 회원에 재사용 (회원마다 bcrypt 하지 않음)
+- 같은 --seed / --until 이면 같은 회원/방 구성/메시지/대화 시각이 생성됨
+  단, 시퀀스에서 발급하는 member_no / talk_room_id 와
+  솔트가 붙는 비밀번호 해시(passwd)는 실행마다 달라짐
+- 아웃박스 이벤트는 기록하지 않음 (분석 파이프라인에 합성 데이터가 흘러가지 않도록)
+(반드시 테스트용 DB 에서 실행할 것)
+
+실행:
+    cd backend
+    python -m bench.seed_data --members 1000000 --rooms-per-member 3 --messages-per-room 40
+    python -m bench.seed_data --members 10000 --seed 7 --prefix load_   # 다른 데이터셋
+    python -m bench.seed_data --until 2025-06-30 --days 30                # 대화 기간 지정
+"""
+import io
+import math
+import time
+import random
+import argparse
+from datetime import datetime, timedelta
+
+from app.core.database import engine
+
+SURNAMES = "김이박최정강조윤장임한오서신권황안송전홍유고문양손배백허남심노하곽성차주우구민류나진지엄채원천방공현함변염여추도소석선설마길연위표명기반라왕금옥육인맹제모탁국어은편용예경봉사부가복태목형피두감음빈동온호범좌"
+GIVEN_SYLLABLES = "민서지현수준우진영연하윤도예은성재호유채원아주빈시정혜나경태인승희동건다소미한결슬기보람"
+WORDS = [
+    "안녕하세요", "오늘", "내일", "어제", "수어", "공부", "같이", "만나요", "고마워요", "괜찮아요",
+    "학교", "회사", "병원", "약속", "시간", "저녁", "점심", "먹었어요", "어디", "가요",
+    "날씨", "좋네요", "비가", "와요", "가족", "친구", "통역", "선생님", "수업", "끝났어요",
+    "버스", "지하철", "도착", "했어요", "조금", "늦어요", "미안해요", "사랑해요", "축하해요", "네",
+]
+
+BATCH_ROWS = 200_000
+
+
+def copy_escape(value) -> str:
+    """COPY text 형식 이스케이프"""
+    if value is None:
+        return "\\N"
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+class CopyWriter:
+    """테이블별 COPY 버퍼 (BATCH_ROWS 마다 전송) + 처리량 집계
+
+    depends_on: 먼저 적재되어야 하는 테이블 (외래 키) - 전송 전에 함께 flush
+    """
+
+    def __init__(self, cursor, table: str, columns: list, depends_on: list = ()):
+        self.cursor = cursor
+        self.depends_on = list(depends_on)
+        self.sql = f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT text)"
+        self.table = table
+        self.buffer = io.StringIO()
+        self.pending = 0
+        self.rows = 0
+        self.seconds = 0.0
+
+    def write(self, *values):
+        self.buffer.write("\t".join(copy_escape(v) for v in values))
+        self.buffer.write("\n")
+        self.pending += 1
+        if self.pending >= BATCH_ROWS:
+            self.flush()
+
+    def flush(self):
+        if not self.pending:
+            return
+        for writer in self.depends_on:
+            writer.flush()
+        self.buffer.seek(0)
+        started = time.perf_counter()
+        self.cursor.copy_expert(self.sql, self.buffer)
+        self.seconds += time.perf_counter() - started
+        self.rows += self.pending
+        self.pending = 0
+        self.buffer = io.StringIO()
+
+    def report(self):
+        rate = self.rows / self.seconds if self.seconds else 0
+        print(f"  {self.table:<40} {self.rows:>12,} 행  COPY {self.seconds:8.2f}초  ({rate:,.0f} 행/초)")
+
+
+def korean_name(rng: random.Random) -> str:
+    return rng.choice(SURNAMES) + "".join(rng.choice(GIVEN_SYLLABLES) for _ in range(2))
+
+
+def message_text(rng: random.Random, mean_len: int) -> str:
+    """평균 mean_len 글자 근처의 메시지 (로그정규 분포)"""
+    target = max(1, int(rng.lognormvariate(math.log(mean_len), 0.6)))
+    words = []
+    length = 0
+    while length < target:
+        word = rng.choice(WORDS)
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)
+
+
+def poisson(rng: random.Random, mean: float) -> int:
+    """포아송 분포 표본 (평균이 크면 정규 근사)"""
+    if mean <= 0:
+        return 0
+    if mean > 30:
+        return max(0, int(round(rng.gauss(mean, math.sqrt(mean)))))
+    limit, k, p = math.exp(-mean), 0, 1.0
+    while True:
+        p *= rng.random()
+        if p <= limit:
+            return k
+        k += 1
+
+
+def reserve_room_ids(cursor, count: int) -> list:
+    cursor.execute(
+        "SELECT nextval('multicampus_schema.talk_room_id_s') FROM generate_series(1, %s)",
+        (count,)
+    )
+    return [row[0] for row in cursor.fetchall()]
+
+
+def seed(args):
+    rng = random.Random(args.seed)
+    conn = engine.raw_connection()
+    cursor = conn.cursor()
+    started = time.perf_counter()
+
+    try:
+        # 비밀번호 해시 1회 계산 (pgcrypto 와 같은 형식)
+        cursor.execute("SELECT crypt(%s, gen_salt('bf'))", (args.password,))
+        password_hash = cursor.fetchone()[0]
+
+        # 대화 기간에 걸친 월 파티션 준비 (기간은 --until 기준 - 실행 시각과 무관)
+        until = args.until
+        start = until - timedelta(days=args.days)
+        cursor.execute("""
+            SELECT multicampus_schema.ensure_talk_partition(m::DATE)
+            FROM generate_series(date_trunc('month', %s::TIMESTAMP), %s::TIMESTAMP, INTERVAL '1 month') AS m
+        """, (start, until))
+
+        # 1. 회원
+        print(f"회원 {args.members:,}명 생성")
+        members = CopyWriter(cursor, "multicampus_schema.member", [
+            "member_id", "passwd", "full_name", "mobile_phone",
+            "e_mail_address", "deaf_muteness_section_code", "create_user"
+        ])
+        member_ids = [f"{args.prefix}{i:08d}" for i in range(args.members)]
+        for i, member_id in enumerate(member_ids):
+            members.write(
+                member_id, password_hash, korean_name(rng),
+                f"010-{rng.randrange(10000):04d}-{rng.randrange(10000):04d}",
+                f"{member_id}@example.com",
+                "t" if rng.random() < args.deaf_ratio else "f",
+                member_id
+            )
+        members.flush()
+
+        cursor.execute(
+            "SELECT member_id, member_no FROM multicampus_schema.member WHERE member_id LIKE %s",
+            (args.prefix.replace("_", "\\_") + "%",)
+        )
+        member_nos = dict(cursor.fetchall())
+        member_nos = [member_nos[member_id] for member_id in member_ids]
+
+        # 2. 채팅방 / 참여자 / 메시지
+        rooms = CopyWriter(cursor, "multicampus_schema.talk_room", [
+            "talk_room_id", "talk_room_name", "is_group", "last_talk_seq", "create_user"
+        ])
+        room_members = CopyWriter(cursor, "multicampus_schema.talk_room_member", [
+            "talk_room_id", "member_no", "create_user"
+        ], depends_on=[rooms])
+        talks = CopyWriter(cursor, "multicampus_schema.talk", [
+            "talk_room_id", "talk_seq", "member_no", "talk_date", "message", "create_user"
+        ], depends_on=[rooms])
+
+        room_ids = []
+        pairs = set()
+        span = (until - start).total_seconds()
+        print(f"채팅방/메시지 생성 (회원당 방 평균 {args.rooms_per_member}, 방당 메시지 중앙값 {args.messages_per_room})")
+
+        for owner in range(args.members):
+            for _ in range(poisson(rng, args.rooms_per_member / 2)):   # 1:1 방은 양쪽 회원에 모두 잡힘
+                if rng.random() < args.group_ratio:
+                    size = rng.randint(3, args.max_group_size)
+                    # 방장을 뺀 회원 중에서 size - 1 명 (방장 이후 번호는 한 칸씩 밀어 방장을 건너뜀)
+                    others = rng.sample(range(args.members - 1), min(size - 1, args.members - 1))
+                    participants = {owner, *(m + (m >= owner) for m in others)}
+                    is_group = True
+                else:
+                    partner = rng.randrange(args.members)
+                    pair = (min(owner, partner), max(owner, partner))
+                    if partner == owner or pair in pairs:
+                        continue
+                    pairs.add(pair)
+                    participants = {owner, partner}
+                    is_group = False
+
+                if not room_ids:
+                    room_ids = reserve_room_ids(cursor, 10_000)
+                room_id = room_ids.pop()
+                creator = member_ids[owner]
+                participants = sorted(participants)
+
+                n_messages = max(0, int(rng.lognormvariate(math.log(max(1, args.messages_per_room)), 1.0)))
+                rooms.write(
+                    room_id, f"그룹 {room_id}" if is_group else None,
+                    "t" if is_group else "f", n_messages, creator
+                )
+                for p in participants:
+                    room_members.write(room_id, member_nos[p], creator)
+
+                # 메시지는 대화 기간 안에서 시간순으로
+                room_start = rng.random() * span
+                gap = (span - room_start) / (n_messages + 1)
+                for seq in range(1, n_messages + 1):
+                    sender = rng.choice(participants)
+                    talk_date = start + timedelta(seconds=room_start + gap * seq)
+                    talks.write(
+                        room_id, seq, member_nos[sender], talk_date.strftime("%Y-%m-%d %H:%M:%S"),
+                        message_text(rng, args.message_len), member_ids[sender]
+                    )
+
+        rooms.flush()
+        room_members.flush()
+        talks.flush()
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+        conn.close()
+
+    elapsed = time.perf_counter() - started
+    total = members.rows + rooms.rows + room_members.rows + talks.rows
+    print(f"\n완료: 총 {total:,} 행 / {elapsed:.1f}초 ({total / elapsed:,.0f} 행/초, 생성 시간 포함)")
+    for writer in (members, rooms, room_members, talks):
+        writer.report()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대량 합성 데이터 생성기")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드 (같으면 같은 데이터)")
+    parser.add_argument("--members", type=int, default=100_000)
+    parser.add_argument("--prefix", default="seed_", help="생성 회원 아이디 접두어")
+    parser.add_argument("--password", default="password1234", help="모든 회원 공통 비밀번호")
+    parser.add_argument("--deaf-ratio", type=float, default=0.5, help="농인 회원 비율")
+    parser.add_argument("--rooms-per-member", type=float, default=3.0, help="회원당 채팅방 수 평균 (포아송)")
+    parser.add_argument("--group-ratio", type=float, default=0.1, help="그룹 채팅방 비율")
+    parser.add_argument("--max-group-size", type=int, default=8)
+    parser.add_argument("--messages-per-room", type=int, default=40, help="방당 메시지 수 중앙값 (로그정규)")
+    parser.add_argument("--message-len", type=int, default=20, help="메시지 길이 중앙값 (글자)")
+    parser.add_argument("--days", type=int, default=90, help="대화가 분포할 일 수 (--until 이전)")
+    parser.add_argument(
+        "--until", type=lambda v: datetime.strptime(v, "%Y-%m-%d"), default=datetime(2025, 1, 1),
+        help="대화 기간의 끝 날짜 YYYY-MM-DD (재현성을 위해 고정값 기본)"
+    )
+    seed(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+"""벤치마크 공용 지연 통계"""
+import statistics
+
+
+def percentile(values: list, p: float) -> float:
+    """최근접 순위 백분위수 (values 는 비어 있지 않아야 함)"""
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def latency_summary(samples: list) -> str:
+    """소요 시간(초) 목록 -> "n=.. p50=..ms p95=..ms p99=..ms mean=..ms" """
+    ms = [s * 1000 for s in samples]
+    return (
+        f"n={len(ms):<6} "
+        f"p50={percentile(ms, 50):7.2f}ms  p95={percentile(ms, 95):7.2f}ms  "
+        f"p99={percentile(ms, 99):7.2f}ms  mean={statistics.mean(ms):7.2f}ms"
+    )
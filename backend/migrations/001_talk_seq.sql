@@ -0,0 +1,39 @@
+-- 채팅방별 메시지 순번 (talk_seq)
+--
+-- talk_room.last_talk_seq : 방마다 마지막으로 발급한 순번
+-- talk.talk_seq           : 방 안에서 단조 증가하는 메시지 순번
+-- 재접속 시 클라이언트는 마지막으로 받은 순번 이후의 메시지만 요청한다.
+
+BEGIN;
+
+ALTER TABLE multicampus_schema.talk_room
+    ADD COLUMN IF NOT EXISTS last_talk_seq BIGINT NOT NULL DEFAULT 0;
+
+ALTER TABLE multicampus_schema.talk
+    ADD COLUMN IF NOT EXISTS talk_seq BIGINT;
+
+-- 기존 대화 내역 순번 채우기 (방별 talk_date 순)
+WITH numbered AS (
+    SELECT ctid AS row_id,
+           ROW_NUMBER() OVER (PARTITION BY talk_room_id ORDER BY talk_date, ctid) AS seq
+    FROM multicampus_schema.talk
+)
+UPDATE multicampus_schema.talk T
+SET talk_seq = N.seq
+FROM numbered N
+WHERE T.ctid = N.row_id;
+
+UPDATE multicampus_schema.talk_room R
+SET last_talk_seq = COALESCE(
+    (SELECT MAX(T.talk_seq) FROM multicampus_schema.talk T WHERE T.talk_room_id = R.talk_room_id),
+    0
+);
+
+ALTER TABLE multicampus_schema.talk
+    ALTER COLUMN talk_seq SET NOT NULL;
+
+-- 구간 조회 (talk_room_id, talk_seq > :since) 용 인덱스
+CREATE UNIQUE INDEX IF NOT EXISTS talk_room_seq_uidx
+    ON multicampus_schema.talk (talk_room_id, talk_seq);
+
+COMMIT;
@@ -0,0 +1,102 @@
+-- talk 테이블 월 단위 파티셔닝 (talk_date 기준 RANGE)
+--
+-- 단일 힙 테이블은 전체 이력에 비례해 인덱스 비대/VACUUM 비용이 커진다.
+-- 월별 파티션으로 나누면 오래된 파티션은 통째로 분리(DETACH)해
+-- 아카이브 파일로 옮길 수 있다. (app/services/talk_archive.py 참고)
+--
+-- 기존 테이블은 talk_legacy 로 이름만 바꿔 남겨둔다.
+-- 데이터 확인 후 수동으로 DROP 할 것.
+
+BEGIN;
+
+ALTER TABLE multicampus_schema.talk RENAME TO talk_legacy;
+ALTER INDEX IF EXISTS multicampus_schema.talk_room_seq_uidx RENAME TO talk_legacy_room_seq_uidx;
+
+CREATE TABLE multicampus_schema.talk (
+    LIKE multicampus_schema.talk_legacy INCLUDING DEFAULTS
+) PARTITION BY RANGE (talk_date);
+
+-- 기본 키 (파티션 키 talk_date 포함 필수)
+-- (talk_room_id, talk_seq) 구간 조회도 이 인덱스를 사용
+-- 방 안 순번 자체의 유일성은 talk_room.last_talk_seq 발급으로 보장
+ALTER TABLE multicampus_schema.talk
+    ADD CONSTRAINT talk_pk PRIMARY KEY (talk_room_id, talk_seq, talk_date);
+
+-- 월별 파티션 생성 함수 (이미 있으면 무시)
+-- 파티션 이름: talk_pYYYYMM
+--
+-- 해당 월 데이터가 이미 DEFAULT 파티션에 들어가 있으면 PostgreSQL 이 파티션 생성을
+-- 거부하므로, DEFAULT 를 잠시 분리하고 새 파티션으로 행을 옮긴 뒤 다시 붙인다.
+CREATE OR REPLACE FUNCTION multicampus_schema.ensure_talk_partition(p_month DATE)
+RETURNS TEXT
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_start DATE := date_trunc('month', p_month)::DATE;
+    v_end   DATE := (date_trunc('month', p_month) + INTERVAL '1 month')::DATE;
+    v_name  TEXT := 'talk_p' || to_char(v_start, 'YYYYMM');
+    v_moved BOOLEAN := FALSE;
+BEGIN
+    IF to_regclass('multicampus_schema.' || v_name) IS NOT NULL THEN
+        RETURN v_name;
+    END IF;
+
+    IF to_regclass('multicampus_schema.talk_default') IS NOT NULL THEN
+        EXECUTE format(
+            'SELECT EXISTS (SELECT 1 FROM multicampus_schema.talk_default
+                             WHERE talk_date >= %L AND talk_date < %L)',
+            v_start, v_end
+        ) INTO v_moved;
+    END IF;
+
+    IF v_moved THEN
+        EXECUTE 'ALTER TABLE multicampus_schema.talk DETACH PARTITION multicampus_schema.talk_default';
+    END IF;
+
+    EXECUTE format(
+        'CREATE TABLE multicampus_schema.%I PARTITION OF multicampus_schema.talk
+             FOR VALUES FROM (%L) TO (%L)',
+        v_name, v_start, v_end
+    );
+
+    IF v_moved THEN
+        EXECUTE format(
+            'INSERT INTO multicampus_schema.%I
+             SELECT * FROM multicampus_schema.talk_default
+             WHERE talk_date >= %L AND talk_date < %L',
+            v_name, v_start, v_end
+        );
+        EXECUTE format(
+            'DELETE FROM multicampus_schema.talk_default
+             WHERE talk_date >= %L AND talk_date < %L',
+            v_start, v_end
+        );
+        EXECUTE 'ALTER TABLE multicampus_schema.talk
+                     ATTACH PARTITION multicampus_schema.talk_default DEFAULT';
+    END IF;
+
+    RETURN v_name;
+END;
+$$;
+
+-- 기존 데이터가 걸친 달 + 앞으로 6개월 파티션 생성
+-- (이후에는 보관 작업이 매번 앞선 파티션을 만들어 둠)
+SELECT multicampus_schema.ensure_talk_partition(m::DATE)
+FROM generate_series(
+    date_trunc('month', COALESCE(
+        (SELECT MIN(talk_date) FROM multicampus_schema.talk_legacy),
+        CURRENT_TIMESTAMP AT TIME ZONE 'Asia/Seoul'
+    )),
+    date_trunc('month', CURRENT_TIMESTAMP AT TIME ZONE 'Asia/Seoul') + INTERVAL '6 months',
+    INTERVAL '1 month'
+) AS m;
+
+-- 범위 밖 데이터 안전망 (정기 작업이 미리 파티션을 만들어 두므로 평소엔 비어 있음)
+-- 들어간 행은 ensure_talk_partition 이 해당 월 파티션 생성 시 옮김
+CREATE TABLE multicampus_schema.talk_default
+    PARTITION OF multicampus_schema.talk DEFAULT;
+
+INSERT INTO multicampus_schema.talk
+SELECT * FROM multicampus_schema.talk_legacy;
+
+COMMIT;
@@ -0,0 +1,36 @@
+-- 채팅방 참여자 테이블 (N명 그룹 채팅)
+--
+-- talk_room.member_no1/member_no2 (2인 고정) 를 talk_room_member 로 대체한다.
+-- 1:1 방은 is_group = FALSE, 그룹 방은 is_group = TRUE.
+
+BEGIN;
+
+ALTER TABLE multicampus_schema.talk_room
+    ADD COLUMN IF NOT EXISTS talk_room_name VARCHAR(100),
+    ADD COLUMN IF NOT EXISTS is_group BOOLEAN NOT NULL DEFAULT FALSE;
+
+CREATE TABLE IF NOT EXISTS multicampus_schema.talk_room_member (
+    talk_room_id INTEGER NOT NULL
+        REFERENCES multicampus_schema.talk_room (talk_room_id) ON DELETE CASCADE,
+    member_no    INTEGER NOT NULL,
+    create_user  VARCHAR(50) NOT NULL,
+    create_date  TIMESTAMP NOT NULL DEFAULT now(),
+    PRIMARY KEY (talk_room_id, member_no)
+);
+
+-- 내 채팅방 목록 조회 (member_no -> talk_room_id)
+CREATE INDEX IF NOT EXISTS talk_room_member_member_idx
+    ON multicampus_schema.talk_room_member (member_no, talk_room_id);
+
+-- 기존 1:1 방 참여자 이관
+INSERT INTO multicampus_schema.talk_room_member (talk_room_id, member_no, create_user)
+SELECT talk_room_id, member_no1, create_user FROM multicampus_schema.talk_room
+UNION
+SELECT talk_room_id, member_no2, create_user FROM multicampus_schema.talk_room
+ON CONFLICT DO NOTHING;
+
+ALTER TABLE multicampus_schema.talk_room
+    DROP COLUMN member_no1,
+    DROP COLUMN member_no2;
+
+COMMIT;
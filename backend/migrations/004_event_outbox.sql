@@ -0,0 +1,23 @@
+-- 이벤트 아웃박스 (Transactional Outbox)
+--
+-- 메시지/채팅방 생성/수어 세션 처리와 같은 트랜잭션에서 이벤트를 기록하고,
+-- 릴레이(app/services/outbox.py)가 배치로 이벤트 로그(Redis Streams 등)에 발행한다.
+-- 분석 파이프라인은 이벤트 로그만 읽으므로 운영 DB를 조회하지 않는다.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS multicampus_schema.event_outbox (
+    event_id     BIGSERIAL PRIMARY KEY,
+    event_type   VARCHAR(50) NOT NULL,
+    aggregate_id VARCHAR(50) NOT NULL,
+    payload      JSONB NOT NULL,
+    create_date  TIMESTAMP NOT NULL DEFAULT (CURRENT_TIMESTAMP AT TIME ZONE 'Asia/Seoul'),
+    publish_date TIMESTAMP
+);
+
+-- 미발행 이벤트 조회용 (발행 완료 행은 인덱스에서 빠짐)
+CREATE INDEX IF NOT EXISTS event_outbox_unpublished_idx
+    ON multicampus_schema.event_outbox (event_id)
+    WHERE publish_date IS NULL;
+
+COMMIT;
@@ -0,0 +1,13 @@
+"""테스트 공통 설정
+
+DB 없이 동작하는 모듈만 테스트하므로 설정 값은 더미로 채움
+"""
+import os
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+for key in ("DB_USER", "DB_PASSWORD", "DB_HOST", "DB_PORT", "DB_NAME", "SECRET_KEY"):
+    os.environ.setdefault(key, "test")
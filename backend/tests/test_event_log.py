@@ -0,0 +1,47 @@
+"""파일 이벤트 로그 (소비자 그룹 오프셋) 테스트"""
+from app.services.outbox import FileEventLog
+
+
+def make_events(start, n):
+    return [{"event_id": i, "event_type": "talk.created", "payload": {"seq": i}} for i in range(start, start + n)]
+
+
+def test_read_and_ack(tmp_path):
+    log = FileEventLog(str(tmp_path))
+    log.append(make_events(1, 5))
+
+    batch = log.read("analytics", count=3)
+    assert [offset for offset, _ in batch] == [1, 2, 3]
+    assert [event["event_id"] for _, event in batch] == [1, 2, 3]
+
+    log.ack("analytics", [offset for offset, _ in batch])
+    assert [event["event_id"] for _, event in log.read("analytics")] == [4, 5]
+
+
+def test_redelivery_without_ack(tmp_path):
+    log = FileEventLog(str(tmp_path))
+    log.append(make_events(1, 3))
+
+    first = log.read("analytics")
+    # 커밋 전에 중단되면 같은 이벤트가 다시 전달됨
+    assert log.read("analytics") == first
+
+    # 새 인스턴스(재시작)에서도 커밋된 오프셋 이후부터 읽음
+    log.ack("analytics", [1])
+    restarted = FileEventLog(str(tmp_path))
+    assert [event["event_id"] for _, event in restarted.read("analytics")] == [2, 3]
+
+
+def test_groups_are_independent(tmp_path):
+    log = FileEventLog(str(tmp_path))
+    assert log.read("analytics") == []
+
+    log.append(make_events(1, 2))
+    log.ack("analytics", [2])
+    log.ack("analytics", [1])   # 더 작은 오프셋으로 되돌아가지 않음
+
+    assert log.read("analytics") == []
+    assert [event["event_id"] for _, event in log.read("search")] == [1, 2]
+
+    log.append(make_events(3, 1))
+    assert [offset for offset, _ in log.read("analytics")] == [3]
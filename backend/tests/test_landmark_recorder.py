@@ -0,0 +1,82 @@
+"""수어 랜드마크 녹화 파일 형식 테스트"""
+import os
+
+from app.services.landmark_recorder import (
+    RECORD_HEADER, LandmarkRecorder, load_sessions, iter_frames
+)
+
+FRAME_VALUES = 3
+FRAME_BYTES = RECORD_HEADER.size + FRAME_VALUES * 4
+
+
+def frame(session: int, i: int) -> list:
+    return [float(session), float(i), i / 4]
+
+
+def test_interleaved_sessions_across_chunks(tmp_path):
+    directory = str(tmp_path)
+    # 청크 하나에 프레임 4개
+    recorder = LandmarkRecorder(directory, FRAME_BYTES * 4)
+
+    for i in range(10):
+        recorder.record_frame("sid-a", frame(1, i), "alice")
+        if i % 2 == 0:
+            recorder.record_frame("sid-b", frame(2, i), "bob")
+    recorder.record_gloss("sid-a", "안녕하세요")
+    recorder.end_session("sid-a")
+    recorder.close()   # 진행 중이던 sid-b 도 인덱스에 기록
+
+    chunks = sorted(os.listdir(directory))
+    assert "index.jsonl" in chunks
+    chunk_files = [name for name in chunks if name.endswith(".bin")]
+    assert len(chunk_files) == 4     # 프레임 15개 / 청크당 4개
+    # 닫힌 청크는 사용한 만큼만 남음
+    assert sum(os.path.getsize(os.path.join(directory, name)) for name in chunk_files) == 15 * FRAME_BYTES
+
+    sessions = {s["member_id"]: s for s in load_sessions(directory)}
+    alice, bob = sessions["alice"], sessions["bob"]
+    assert alice["frames"] == 10 and bob["frames"] == 5
+    assert len(alice["chunks"]) > 1
+    assert [g[1] for g in alice["glosses"]] == ["안녕하세요"]
+    assert bob["ended_at"] is not None
+
+    alice_frames = list(iter_frames(directory, alice))
+    assert [values for _, values in alice_frames] == [frame(1, i) for i in range(10)]
+    assert [ts for ts, _ in alice_frames] == sorted(ts for ts, _ in alice_frames)
+    assert [values for _, values in iter_frames(directory, bob)] == [frame(2, i) for i in range(0, 10, 2)]
+
+
+def test_session_without_frames_is_dropped(tmp_path):
+    recorder = LandmarkRecorder(str(tmp_path), FRAME_BYTES * 4)
+    recorder.start_session("sid-a", "alice")
+    assert recorder.end_session("sid-a") is None
+    recorder.close()
+    assert load_sessions(str(tmp_path)) == []
+
+
+def test_chunk_numbering_skips_existing_files(tmp_path):
+    directory = str(tmp_path)
+    pid = os.getpid()
+    # 다른 워커(또는 같은 pid 를 썼던 이전 프로세스)가 이미 만든 청크
+    for name in (f"chunk_{pid}_000001.bin", f"chunk_{pid}_000003.bin", "chunk_000002.bin"):
+        with open(os.path.join(directory, name), "wb") as f:
+            f.write(b"existing")
+
+    recorder = LandmarkRecorder(directory, FRAME_BYTES)
+    other = LandmarkRecorder(directory, FRAME_BYTES)   # 같은 디렉터리를 쓰는 두 번째 녹화기
+    for i in range(2):
+        recorder.record_frame("sid-a", frame(1, i), "alice")
+        other.record_frame("sid-b", frame(2, i), "bob")
+    recorder.close()
+    other.close()
+
+    used = {name for s in load_sessions(directory) for name, _, _ in s["chunks"]}
+    assert used == {f"chunk_{pid}_{n:06d}.bin" for n in (4, 5, 6, 7)}
+    # 기존 청크는 덮어쓰지 않음
+    for name in (f"chunk_{pid}_000001.bin", f"chunk_{pid}_000003.bin", "chunk_000002.bin"):
+        with open(os.path.join(directory, name), "rb") as f:
+            assert f.read() == b"existing"
+
+    sessions = {s["member_id"]: s for s in load_sessions(directory)}
+    assert [v for _, v in iter_frames(directory, sessions["alice"])] == [frame(1, i) for i in range(2)]
+    assert [v for _, v in iter_frames(directory, sessions["bob"])] == [frame(2, i) for i in range(2)]
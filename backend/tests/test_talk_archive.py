@@ -0,0 +1,68 @@
+"""대화 아카이브 파일 형식 테스트"""
+from datetime import datetime, timedelta
+
+from app.core.config import settings
+from app.services import talk_archive
+from app.services.talk_archive import TalkArchiveService, write_archive_file, read_archive_room
+
+BASE = datetime(2025, 1, 1, 9, 0, 0, 123456)
+
+
+def make_rows(room_ids, per_room):
+    """(talk_room_id, talk_seq) 순으로 정렬된 행"""
+    return [
+        (room_id, seq, 100 + room_id, BASE + timedelta(minutes=seq), f"메시지 {room_id}-{seq}", f"user{room_id}")
+        for room_id in room_ids
+        for seq in range(1, per_room + 1)
+    ]
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / "talk_p202501.tca")
+    header = write_archive_file(path, "talk_p202501", make_rows([1, 2, 3], 5))
+
+    assert header["rows"] == 15
+    assert header["rooms"]["2"] == [5, 10, 1, 5]
+    assert read_archive_room(path, 2) == [
+        (seq, 102, BASE + timedelta(minutes=seq), f"메시지 2-{seq}") for seq in range(1, 6)
+    ]
+    assert read_archive_room(path, 99) == []
+
+
+def test_since_filter(tmp_path):
+    path = str(tmp_path / "talk_p202501.tca")
+    write_archive_file(path, "talk_p202501", make_rows([7], 10))
+
+    assert [row[0] for row in read_archive_room(path, 7, since=6)] == [7, 8, 9, 10]
+    assert read_archive_room(path, 7, since=10) == []
+
+
+def test_multiple_row_groups(tmp_path, monkeypatch):
+    monkeypatch.setattr(talk_archive, "ROW_GROUP_SIZE", 4)
+    path = str(tmp_path / "talk_p202501.tca")
+    header = write_archive_file(path, "talk_p202501", make_rows([1, 2, 3], 7))
+
+    assert len(header["groups"]) == 6
+    # 방 2 (행 7~13) 는 세 개의 행 그룹에 걸쳐 있음
+    assert [row[0] for row in read_archive_room(path, 2)] == list(range(1, 8))
+    assert [row[3] for row in read_archive_room(path, 3, since=5)] == ["메시지 3-6", "메시지 3-7"]
+
+
+def test_room_messages_from_manifest(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "TALK_ARCHIVE_DIR", str(tmp_path))
+    monkeypatch.setattr(TalkArchiveService, "_manifest_cache", {"mtime": None, "data": None})
+
+    manifest = {"partitions": {}}
+    for month, seqs in (("202501", range(1, 4)), ("202502", range(4, 7))):
+        partition = f"talk_p{month}"
+        rows = [(5, seq, 105, BASE + timedelta(days=seq), f"m{seq}", "user5") for seq in seqs]
+        header = write_archive_file(str(tmp_path / f"{partition}.tca"), partition, rows)
+        manifest["partitions"][partition] = {
+            "file": f"{partition}.tca",
+            "rows": header["rows"],
+            "rooms": {room: info[3] for room, info in header["rooms"].items()},
+        }
+    TalkArchiveService._save_manifest(manifest)
+
+    assert [row[0] for row in TalkArchiveService.get_room_messages(5)] == [1, 2, 3, 4, 5, 6]
+    assert [row[0] for row in TalkArchiveService.get_room_messages(5, since=4)] == [5, 6]
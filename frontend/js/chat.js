@@ -1,6 +1,6 @@
 /**
  * 채팅 기능
- * Socket.IO 기반 실시간 1:1 채팅
+ * Socket.IO 기반 실시간 채팅 (1:1 / 그룹)
  */
 
 const BASE_URL = "http://localhost:8000";
@@ -8,7 +8,15 @@ const myId = localStorage.getItem("userId");
 const myName = localStorage.getItem("userName");
 
 let currentRoomId = null;    // DB 방 번호
-let currentRoomName = null;  // 소켓 방 이름 (user1_user2)
+let lastSeq = 0;             // 현재 방에서 마지막으로 받은 메시지 순번
+let pendingMessages = null;  // 내역 로딩/재동기화 중 도착한 실시간 메시지 (완료 후 반영)
+let resumeTimer = null;      // 재동기화 응답 대기 타이머 (시간 초과 시 HTTP 내역으로 대체)
+
+const RESUME_TIMEOUT_MS = 5000;
+
+// 방별 대화 캐시 { room_id: { lastSeq, messages: [...] } }
+// 방을 다시 열 때 전체 내역 대신 lastSeq 이후만 요청
+const roomCache = {};
 
 const socket = io(BASE_URL);
 
@@ -49,19 +57,102 @@ document.addEventListener("DOMContentLoaded", () => {
 });
 
 // ======== 소켓 이벤트 ========
+socket.on("connect", () => {
+    // 재접속 시 현재 방 재입장 + 끊긴 동안의 메시지만 요청
+    if (currentRoomId) {
+        socket.emit("join_room", { room_id: currentRoomId, username: myId });
+        requestResume();
+    }
+});
+
 socket.on("receive_message", (data) => {
     console.log("📥 [Socket] 메시지 수신:", data);
     
     if (data.sender && data.message) {
+        if (data.room_id && data.room_id !== currentRoomId) return;
+
         const timeStr = data.time || new Date().toLocaleTimeString([], { 
             hour: '2-digit', 
             minute: '2-digit', 
             hour12: false 
         });
-        displayMessage(data.sender, data.sender_name, data.message, timeStr);
+        const chat = {
+            seq: data.seq,
+            sender: data.sender,
+            sender_name: data.sender_name,
+            message: data.message,
+            time: timeStr
+        };
+
+        appendChat(chat);
     }
 });
 
+socket.on("resume_messages", (data) => {
+    if (!data || data.room_id !== currentRoomId) return;
+    if (data.error) {
+        console.warn(`⚠️ [Socket] 재동기화 실패 (${data.error}) - HTTP 내역으로 대체`);
+        fallbackResume(currentRoomId);
+        return;
+    }
+    clearTimeout(resumeTimer);
+    resumeTimer = null;
+    (data.messages || []).forEach(chat => appendChat(toDisplayChat(chat), true));
+    flushPending();
+});
+
+socket.on("removed_from_room", (data) => {
+    /* 그룹에서 제거됨 -> 방 닫고 목록 갱신 */
+    if (!data) return;
+    delete roomCache[data.room_id];
+    if (data.room_id === currentRoomId) {
+        currentRoomId = null;
+        pendingMessages = null;
+        document.getElementById("messages").innerHTML = "";
+        document.getElementById("chatTitle").textContent = "";
+        alert("채팅방에서 제거되었습니다.");
+    }
+    fetchMyFriends();
+});
+
+function requestResume() {
+    /* 누락 구간 요청 (응답이 올 때까지 실시간 메시지는 보류) */
+    if (!pendingMessages) pendingMessages = [];
+    socket.emit("resume", { room_id: currentRoomId, username: myId, since: lastSeq });
+    console.log(`🔁 [Socket] 재동기화 요청: room ${currentRoomId} since ${lastSeq}`);
+
+    // 응답이 없으면 (연결 끊김 등) HTTP 로 대체해 보류가 풀리지 않는 일이 없도록
+    const roomId = currentRoomId;
+    clearTimeout(resumeTimer);
+    resumeTimer = setTimeout(() => fallbackResume(roomId), RESUME_TIMEOUT_MS);
+}
+
+async function fallbackResume(roomId) {
+    /* 재동기화 실패/시간 초과 시 HTTP 로 누락 구간 조회 후 보류 해제 */
+    clearTimeout(resumeTimer);
+    resumeTimer = null;
+    if (roomId !== currentRoomId || !pendingMessages) return;
+
+    try {
+        const res = await fetch(`${BASE_URL}/chat/history/${roomId}?since=${lastSeq}`);
+        if (res.ok && roomId === currentRoomId) {
+            const historyArr = await res.json();
+            historyArr.forEach(chat => appendChat(toDisplayChat(chat), true));
+        }
+    } catch (e) {
+        console.error("❌ 누락 메시지 조회 실패:", e);
+    }
+    if (roomId === currentRoomId) flushPending();
+}
+
+function flushPending() {
+    /* 보류했던 실시간 메시지를 순번 순으로 반영 */
+    const pending = pendingMessages || [];
+    pendingMessages = null;
+    pending.sort((a, b) => (a.seq || 0) - (b.seq || 0));
+    pending.forEach(chat => appendChat(chat));
+}
+
 // ======== API 함수 ========
 async function fetchMyFriends() {
     /* 내 친구 목록 가져오기 */
@@ -80,15 +171,16 @@ async function fetchMyFriends() {
             return;
         }
 
-        friends.forEach(user => {
+        friends.forEach(room => {
             const itemDiv = document.createElement("div");
             itemDiv.className = "friend-item";
+            const subText = room.is_group ? `${room.members.length + 1}명` : room.user_id;
             itemDiv.innerHTML = `
                 <div style="font-weight:500;">
-                    ${user.user_name} 
-                    <span style="font-size:12px; color:#888;">(${user.user_id})</span>
+                    ${room.user_name} 
+                    <span style="font-size:12px; color:#888;">(${subText})</span>
                 </div>`;
-            itemDiv.onclick = () => startChat(user, itemDiv);
+            itemDiv.onclick = () => startChat(room, itemDiv);
             listContainer.appendChild(itemDiv);
         });
     } catch (error) {
@@ -185,7 +277,7 @@ async function addFriend(targetId) {
 }
 
 // ======== 채팅 핵심 로직 ========
-async function startChat(friend, clickedElement) {
+async function startChat(room, clickedElement) {
     /* 채팅방 입장 */
     // UI 활성화
     const allItems = document.querySelectorAll('.friend-item');
@@ -193,57 +285,47 @@ async function startChat(friend, clickedElement) {
     if (clickedElement) clickedElement.classList.add('active');
 
     // 이전 방 퇴장
-    if (currentRoomName) {
-        socket.emit("leave_room", { room: currentRoomName, username: myId });
+    if (currentRoomId) {
+        socket.emit("leave_room", { room_id: currentRoomId, username: myId });
     }
 
     try {
-        // 방 번호 조회/생성
-        const roomRes = await fetch(`${BASE_URL}/chat/room`, {
-            method: "POST",
-            headers: { "Content-Type": "application/json" },
-            body: JSON.stringify({ my_id: myId, target_id: friend.user_id })
-        });
-        const roomData = await roomRes.json();
-        currentRoomId = roomData.room_id;
-
-        // 소켓 방 이름 생성
-        const participants = [myId, friend.user_id].sort();
-        currentRoomName = participants.join("_");
+        currentRoomId = room.room_id;
 
         // 화면 초기화
         document.getElementById("messages").innerHTML = "";
-        document.getElementById("chatTitle").textContent = `${friend.user_name}님과의 대화`;
+        document.getElementById("chatTitle").textContent = room.is_group
+            ? room.user_name
+            : `${room.user_name}님과의 대화`;
         document.getElementById("messageInput").focus();
 
-        // 소켓 방 입장
-        socket.emit("join_room", { room: currentRoomName, username: myId });
-        console.log(`🏠 [Socket] 방 입장: ${currentRoomName} (ID: ${currentRoomId})`);
+        // 캐시된 내역 먼저 표시
+        const cache = roomCache[currentRoomId] || { lastSeq: 0, messages: [] };
+        roomCache[currentRoomId] = cache;
+        lastSeq = cache.lastSeq;
+        cache.messages.forEach(chat => {
+            displayMessage(chat.sender, chat.sender_name, chat.message, chat.time);
+        });
 
-        // 과거 대화 내역 로드
-        const historyRes = await fetch(`${BASE_URL}/chat/history/${currentRoomId}`);
+        // 소켓 방 입장 (내역 로딩 중 도착한 메시지는 보류)
+        pendingMessages = [];
+        socket.emit("join_room", { room_id: currentRoomId, username: myId });
+        console.log(`🏠 [Socket] 방 입장: ${currentRoomId}`);
+
+        // 캐시 이후 대화 내역만 로드
+        const historyRes = await fetch(`${BASE_URL}/chat/history/${currentRoomId}?since=${lastSeq}`);
         const historyArr = await historyRes.json();
 
-        historyArr.forEach(chat => {
-            let timeStr = chat.date;
-            try {
-                const dateObj = new Date(chat.date);
-                if (!isNaN(dateObj)) {
-                    timeStr = dateObj.toLocaleTimeString([], { 
-                        hour: '2-digit', 
-                        minute: '2-digit', 
-                        hour12: false 
-                    });
-                }
-            } catch(e) {}
-
-            displayMessage(chat.sender, chat.sender_name, chat.message, timeStr);
-        });
+        historyArr.forEach(chat => appendChat(toDisplayChat(chat), true));
+
+        // 보류했던 실시간 메시지 반영 (순번 중복 제거)
+        flushPending();
 
         // 스크롤 맨 아래로
         const msgBox = document.getElementById("messages");
         msgBox.scrollTop = msgBox.scrollHeight;
     } catch (error) {
+        pendingMessages = null;
         console.error("❌ 채팅방 입장 실패:", error);
         alert("채팅방을 불러오는 데 실패했습니다.");
     }
@@ -255,13 +337,12 @@ function sendMessage() {
     const msg = input.value.trim();
 
     if (!msg) return;
-    if (!currentRoomName || !currentRoomId) {
+    if (!currentRoomId) {
         alert("대화 상대를 먼저 선택해주세요.");
         return;
     }
 
     socket.emit("send_message", {
-        room: currentRoomName,
         room_id: currentRoomId,
         username: myId,
         message: msg
@@ -272,6 +353,60 @@ function sendMessage() {
     input.focus();
 }
 
+function toDisplayChat(chat) {
+    /* 서버 내역 항목 -> 표시용 객체 */
+    let timeStr = chat.date;
+    try {
+        const dateObj = new Date(chat.date);
+        if (!isNaN(dateObj)) {
+            timeStr = dateObj.toLocaleTimeString([], { 
+                hour: '2-digit', 
+                minute: '2-digit', 
+                hour12: false 
+            });
+        }
+    } catch(e) {}
+
+    return {
+        seq: chat.seq,
+        sender: chat.sender,
+        sender_name: chat.sender_name,
+        message: chat.message,
+        time: timeStr
+    };
+}
+
+function appendChat(chat, allowGap = false) {
+    /* 순번 기준으로 중복을 거르고 화면/캐시에 추가
+     * 실시간 메시지(allowGap=false)는 보류 중이면 보류 목록으로,
+     * 순번이 건너뛰면(lastSeq + 1 초과) 보류 후 누락 구간 재요청
+     * 내역/재동기화 응답(allowGap=true)은 바로 반영
+     */
+    if (chat.seq) {
+        if (chat.seq <= lastSeq) return;
+        if (!allowGap) {
+            if (pendingMessages) {
+                pendingMessages.push(chat);
+                return;
+            }
+            if (chat.seq > lastSeq + 1) {
+                pendingMessages = [chat];
+                requestResume();
+                return;
+            }
+        }
+        lastSeq = chat.seq;
+    }
+
+    const cache = roomCache[currentRoomId];
+    if (cache) {
+        cache.messages.push(chat);
+        cache.lastSeq = lastSeq;
+    }
+
+    displayMessage(chat.sender, chat.sender_name, chat.message, chat.time);
+}
+
 function displayMessage(senderId, senderName, msg, time) {
     /* 말풍선 렌더링 */
     const msgBox = document.getElementById("messages");